@@ -1,4 +1,17 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # optional build dependency
+    cythonize = None
+
+# The compiled directory walk is optional; the engine falls back to Python
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [Extension("minbackup._walk", ["src/minbackup/_walk.pyx"], optional=True)],
+        language_level=3,
+    )
 
 setup(
     name="minbackup",
@@ -7,10 +20,18 @@ setup(
     author="Entro01",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     install_requires=[
         "click>=8.0.0",
         "PyYAML>=6.0",
     ],
+    extras_require={
+        "blake3": ["blake3>=0.3.0"],
+        "zstd": ["zstandard>=0.15"],
+        "cdc": ["fastcdc>=1.4"],
+        "orjson": ["orjson>=3.0"],
+        "crc32c": ["google-crc32c>=1.1"],
+    },
     entry_points={
         "console_scripts": [
             "minbackup=minbackup.cli:main",
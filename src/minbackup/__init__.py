@@ -8,14 +8,25 @@ with retention management.
 __version__ = "0.1.0"
 __author__ = "Entro01"
 
-from .backup_engine import BackupEngine
-from .vm_manager import VMManager
-from .storage_manager import StorageManager
-from .config import Config
-
 __all__ = [
     "BackupEngine",
     "VMManager", 
     "StorageManager",
     "Config"
-]
\ No newline at end of file
+]
+
+# Public classes are imported on first access, so the CLI does not load
+# the backup engine's compression and archive modules on every run
+_EXPORTS = {
+    "BackupEngine": ".backup_engine",
+    "VMManager": ".vm_manager",
+    "StorageManager": ".storage_manager",
+    "Config": ".config",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
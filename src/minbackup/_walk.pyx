@@ -0,0 +1,67 @@
+# cython: language_level=3
+"""Compiled directory walk used by the backup engine when available."""
+
+import os
+from os.path import normcase
+
+
+def walk(str directory, Py_ssize_t prefix_len, exclude_re, tuple exclude_dirs, warn):
+    """Walk a directory tree yielding files that are not excluded.
+    
+    Mirrors BackupEngine._walk_directory and BackupEngine._should_exclude,
+    including yielding each file as it is found so callers can stream.
+    
+    Args:
+        directory: Directory to walk
+        prefix_len: Length of the base directory prefix stripped for archive names
+        exclude_re: Compiled exclude regex or None
+        exclude_dirs: Tuple of excluded directory substrings
+        warn: Callable taking a message, called for skipped entries
+        
+    Yields:
+        Tuples of (file_path, arcname, size)
+    """
+    cdef list stack = [directory]
+    cdef str path, folded, exclude_dir, current
+    cdef bint excluded
+    
+    match = exclude_re.match if exclude_re is not None else None
+    
+    while stack:
+        current = stack.pop()
+        
+        # Directories that are unreadable or removed mid-walk are skipped
+        try:
+            it = os.scandir(current)
+        except OSError as e:
+            warn(f"Skipping directory {current}: {e}")
+            continue
+        
+        with it:
+            for entry in it:
+                path = entry.path
+                folded = normcase(path)
+                
+                if match is not None and (match(folded) or match(normcase(entry.name))):
+                    continue
+                
+                excluded = False
+                for exclude_dir in exclude_dirs:
+                    if exclude_dir in folded:
+                        excluded = True
+                        break
+                if excluded:
+                    continue
+                
+                if entry.is_dir():
+                    # Like os.walk, do not descend into symlinked directories
+                    if not entry.is_symlink():
+                        stack.append(path)
+                else:
+                    try:
+                        size = entry.stat(follow_symlinks=False).st_size
+                    except OSError as e:
+                        warn(f"Skipping file {path}: {e}")
+                        continue
+                    
+                    yield path, path[prefix_len:], size
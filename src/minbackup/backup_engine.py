@@ -1,21 +1,119 @@
 """Core backup engine for file and directory backup operations."""
 
 import os
+import re
+import copy
+import gzip
 import json
+import time
+import shutil
+import sqlite3
 import tarfile
 import fnmatch
+import logging
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .utils import (
     NotificationManager, 
+    HashingWriter,
+    ChunkedCRC,
     generate_timestamp, 
     calculate_checksum,
+    calculate_chunk_crcs,
+    new_hash,
     format_size,
-    ensure_directory
+    DEFAULT_CHECKSUM_ALGORITHM,
+    DEFAULT_CRC_ALGORITHM,
+    ensure_directory,
+    json_loads,
+    write_json_atomic
 )
 
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+try:
+    from fastcdc import fastcdc
+except ImportError:  # optional dependency
+    fastcdc = None
+
+try:
+    from ._walk import walk as _native_walk
+except ImportError:  # optional compiled extension
+    _native_walk = None
+
+
+# Archive file extension per supported compression
+ARCHIVE_EXTENSIONS = {
+    "gzip": ".tar.gz",
+    "zstd": ".tar.zst",
+}
+
+# zstd decodes several times faster than gzip; default to it only when the
+# zstandard package is there, so StorageManager can read the archives back
+DEFAULT_COMPRESSION = "zstd" if zstandard is not None else "gzip"
+
+# Large buffers keep tarfile/zlib and the OS write path out of small-block mode
+OUTPUT_BUFFER_SIZE = 8 * 1024 * 1024
+TAR_STREAM_BUFSIZE = 1024 * 1024
+
+# Archive bytes covered by each CRC used for quick verification
+ARCHIVE_CRC_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Minimum seconds between "Processed N files" progress messages
+PROGRESS_INTERVAL = 1.0
+
+# Incremental backups write a manifest instead of an archive
+MANIFEST_EXTENSION = ".manifest.json"
+
+# SQLite index of already chunked files, kept in the backup destination
+INDEX_FILENAME = "index.db"
+
+# Deduplicated chunks of incremental backups live in this subdirectory
+CHUNK_STORE_DIRNAME = "chunks"
+
+# Content-defined chunk sizes for the incremental chunk store
+CHUNK_MIN_SIZE = 1 << 20
+CHUNK_AVG_SIZE = 4 << 20
+CHUNK_MAX_SIZE = 16 << 20
+
+# Stored chunk file extension per compression
+CHUNK_EXTENSIONS = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+# The external pipeline needs GNU tar 1.29+ for --no-verbatim-files-from
+# and --directory lines in a NUL-separated file list
+GNU_TAR_MIN_VERSION = (1, 29)
+GNU_TAR_VERSION_RE = re.compile(r'GNU tar\)?\s+(\d+)\.(\d+)')
+
+
+@lru_cache(maxsize=None)
+def _gnu_tar_available() -> bool:
+    """Check once whether `tar` is a GNU tar recent enough for the pipeline.
+    
+    bsdtar (macOS, Windows tar.exe) and older GNU tar read the file list
+    differently, so those fall back to Python's tarfile.
+    """
+    if not shutil.which("tar"):
+        return False
+    try:
+        result = subprocess.run(["tar", "--version"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    match = GNU_TAR_VERSION_RE.search(result.stdout)
+    return match is not None and (int(match.group(1)), int(match.group(2))) >= GNU_TAR_MIN_VERSION
+
 
 class BackupEngine:
     """Core backup engine for creating and managing file backups."""
@@ -31,6 +129,7 @@ class BackupEngine:
         self.notifier = notification_manager or NotificationManager(config)
         self.backup_destination = Path(config.backup_destination)
         ensure_directory(self.backup_destination)
+        self._exclude_re, self._exclude_dirs = self._compile_exclude_patterns(config.exclude_patterns)
     
     def create_backup(self, source_paths: List[str], backup_name: Optional[str] = None) -> Dict[str, Any]:
         """Create a backup of specified source paths.
@@ -44,12 +143,24 @@ class BackupEngine:
         """
         self.notifier.info("Starting backup operation...")
         
+        compression = self.config.get('backup.compression', DEFAULT_COMPRESSION)
+        if compression not in ARCHIVE_EXTENSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        
+        mode = self.config.get('backup.mode', 'full')
+        if mode == 'incremental':
+            extension = MANIFEST_EXTENSION
+        elif mode == 'full':
+            extension = ARCHIVE_EXTENSIONS[compression]
+        else:
+            raise ValueError(f"Unsupported backup mode: {mode}")
+        
         # Generate backup name and paths
         timestamp = generate_timestamp()
         if backup_name:
-            backup_filename = f"{backup_name}_{timestamp}.tar.gz"
+            backup_filename = f"{backup_name}_{timestamp}{extension}"
         else:
-            backup_filename = f"backup_{timestamp}.tar.gz"
+            backup_filename = f"backup_{timestamp}{extension}"
         
         backup_path = self.backup_destination / backup_filename
         metadata_path = self.backup_destination / f"{backup_filename}.meta.json"
@@ -62,13 +173,14 @@ class BackupEngine:
         
         # Create backup metadata
         metadata = {
-            "backup_id": backup_filename.replace('.tar.gz', ''),
+            "backup_id": backup_filename[:-len(extension)],
             "timestamp": timestamp,
             "created_at": datetime.now().isoformat(),
             "source_paths": valid_sources,
             "backup_file": backup_filename,
-            "compression": self.config.get('backup.compression', 'gzip'),
-            "checksum_algorithm": self.config.get('backup.checksum', 'sha256'),
+            "mode": mode,
+            "compression": compression,
+            "checksum_algorithm": self.config.get('backup.checksum', DEFAULT_CHECKSUM_ALGORITHM),
             "files_count": 0,
             "total_size": 0,
             "compressed_size": 0,
@@ -77,15 +189,22 @@ class BackupEngine:
         }
         
         try:
-            # Create compressed backup
             self.notifier.info(f"Creating backup: {backup_filename}")
-            files_count, total_size = self._create_compressed_backup(
-                valid_sources, backup_path, metadata["exclude_patterns"]
-            )
-            
-            # Calculate backup file size and checksum
-            compressed_size = backup_path.stat().st_size
-            checksum = calculate_checksum(backup_path, metadata["checksum_algorithm"])
+            if mode == 'incremental':
+                # Only chunks not already in the store count towards the size
+                files_count, total_size, compressed_size, checksum = self._create_chunked_backup(
+                    valid_sources, backup_path, compression, metadata["checksum_algorithm"]
+                )
+            else:
+                # Create compressed backup
+                files_count, total_size, compressed_size, checksum, chunk_crcs = self._create_compressed_backup(
+                    valid_sources, backup_path, compression, metadata["checksum_algorithm"]
+                )
+                metadata.update({
+                    "chunk_crc": DEFAULT_CRC_ALGORITHM,
+                    "chunk_size": ARCHIVE_CRC_CHUNK_SIZE,
+                    "chunk_crcs": chunk_crcs
+                })
             
             # Update metadata
             metadata.update({
@@ -136,72 +255,517 @@ class BackupEngine:
         return valid_sources
     
     def _create_compressed_backup(self, source_paths: List[str], backup_path: Path, 
-                                exclude_patterns: List[str]) -> tuple:
-        """Create compressed tar.gz backup.
+                                compression: str, checksum_algorithm: str) -> tuple:
+        """Create compressed tar backup.
+        
+        Uses a ``tar | pigz`` (or ``tar | zstd``) pipeline when the tools are
+        installed so that compression runs on all cores, and falls back to
+        Python's tarfile. The checksum and per-chunk CRCs are computed on the
+        compressed bytes as they are written.
         
         Args:
             source_paths: List of source paths
             backup_path: Path for backup file
-            exclude_patterns: List of exclude patterns
+            compression: Compression algorithm ('gzip' or 'zstd')
+            checksum_algorithm: Hash algorithm for the archive checksum
             
         Returns:
-            Tuple of (files_count, total_size)
+            Tuple of (files_count, total_size, compressed_size, checksum, chunk_crcs)
+        """
+        with open(backup_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as output:
+            chunk_crc = ChunkedCRC(ARCHIVE_CRC_CHUNK_SIZE)
+            writer = HashingWriter(output, checksum_algorithm, chunk_crc)
+            compress_cmd = self._compressor_command(compression)
+            
+            try:
+                if compress_cmd and _gnu_tar_available():
+                    # Paths stream into tar while the tree is still being walked
+                    files_count, total_size = self._write_external_archive(
+                        self._iter_files(source_paths), writer, compress_cmd
+                    )
+                else:
+                    source_entries = [self._collect_files([source_path]) for source_path in source_paths]
+                    entries = [entry for part in source_entries for entry in part]
+                    files_count = len(entries)
+                    total_size = sum(size for _, _, _, size in entries)
+                    parts = [part for part in source_entries if part]
+                    
+                    if compress_cmd:
+                        self._write_piped_archive(entries, writer, compress_cmd)
+                    elif len(parts) > 1:
+                        self._write_parallel_archive(parts, writer, compression)
+                    else:
+                        # Stream mode: no seeking, compressed data flushed in large blocks
+                        with self._open_compressed_writer(writer, compression) as stream:
+                            with tarfile.open(fileobj=stream, mode='w|', bufsize=TAR_STREAM_BUFSIZE) as tar:
+                                for file_path, _, arcname, _ in entries:
+                                    tar.add(file_path, arcname=arcname)
+            finally:
+                writer.close()
+        
+        checksum = writer.hexdigest()
+        return files_count, total_size, writer.bytes_written, checksum, chunk_crc.finish()
+    
+    def _create_chunked_backup(self, source_paths: List[str], manifest_path: Path,
+                               compression: str, checksum_algorithm: str) -> tuple:
+        """Create incremental backup in the deduplicating chunk store.
+        
+        Files are split into content-defined chunks (fixed-size chunks when
+        fastcdc is not installed). Each chunk is stored once under
+        chunks/<hh>/<hash>; the manifest lists the chunks of every file.
+        Files whose mtime and size match the index are not read again.
+        
+        Args:
+            source_paths: List of source paths
+            manifest_path: Path for the manifest file
+            compression: Compression applied to newly stored chunks
+            checksum_algorithm: Hash algorithm for the manifest checksum
+            
+        Returns:
+            Tuple of (files_count, total_size, stored_size, checksum)
         """
-        files_count = 0
+        chunk_store = self.backup_destination / CHUNK_STORE_DIRNAME
+        files = []
         total_size = 0
+        stored_size = 0
+        changed = []
         
-        with tarfile.open(backup_path, 'w:gz') as tar:
-            for source_path in source_paths:
-                source_obj = Path(source_path)
+        index = self._open_index()
+        try:
+            for file_path, _, arcname, _ in self._collect_files(source_paths):
+                stat = os.stat(file_path)
+                size = stat.st_size
+                
+                row = index.execute(
+                    "SELECT chunks FROM files WHERE path = ? AND mtime_ns = ? AND size = ? AND compression = ?",
+                    (file_path, stat.st_mtime_ns, size, compression)
+                ).fetchone()
                 
-                if source_obj.is_file():
-                    if not self._should_exclude(source_path, exclude_patterns):
-                        tar.add(source_path, arcname=source_obj.name)
-                        files_count += 1
-                        total_size += source_obj.stat().st_size
-                        self.notifier.info(f"Added file: {source_path}")
+                if row:
+                    # Unchanged since it was last chunked: reuse the stored chunk list
+                    chunks = json.loads(row[0])
+                else:
+                    chunks = []
+                    for data in _iter_chunks(file_path, size):
+                        hash_obj = new_hash(DEFAULT_CHECKSUM_ALGORITHM)
+                        hash_obj.update(data)
+                        chunk_hash = hash_obj.hexdigest()
+                        stored_size += self._store_chunk(chunk_store, chunk_hash, data, compression)
+                        chunks.append(chunk_hash)
+                    changed.append((file_path, stat.st_mtime_ns, size, compression, json.dumps(chunks)))
                 
-                elif source_obj.is_dir():
-                    for root, dirs, files in os.walk(source_path):
-                        # Filter directories
-                        dirs[:] = [d for d in dirs if not self._should_exclude(
-                            os.path.join(root, d), exclude_patterns)]
+                files.append({"path": arcname, "size": size, "chunks": chunks})
+                total_size += size
+            
+            with index:
+                index.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", changed)
+        finally:
+            index.close()
+        
+        manifest = {
+            "chunk_hash": DEFAULT_CHECKSUM_ALGORITHM,
+            "chunk_compression": compression,
+            "files": files
+        }
+        
+        with open(manifest_path, 'wb') as output:
+            writer = HashingWriter(output, checksum_algorithm)
+            writer.write(json.dumps(manifest).encode())
+            checksum = writer.hexdigest()
+        
+        return len(files), total_size, stored_size, checksum
+    
+    def _open_index(self) -> sqlite3.Connection:
+        """Open the incremental file index, creating it if needed.
+        
+        Returns:
+            SQLite connection to the index database
+        """
+        index = sqlite3.connect(self.backup_destination / INDEX_FILENAME)
+        index.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, compression TEXT, chunks TEXT)"
+        )
+        return index
+    
+    def _store_chunk(self, chunk_store: Path, chunk_hash: str, data: bytes, compression: str) -> int:
+        """Store a chunk unless the store already has it.
+        
+        Args:
+            chunk_store: Chunk store directory
+            chunk_hash: Hash of the uncompressed chunk data
+            data: Chunk data
+            compression: Compression algorithm
+            
+        Returns:
+            Number of bytes written to the store
+        """
+        chunk_path = chunk_store / chunk_hash[:2] / f"{chunk_hash}{CHUNK_EXTENSIONS[compression]}"
+        if chunk_path.exists():
+            return 0
+        
+        ensure_directory(chunk_path.parent)
+        if compression == "zstd":
+            if zstandard is None:
+                raise ValueError("zstd compression requires the 'zstandard' package")
+            payload = zstandard.ZstdCompressor(level=3).compress(data)
+        else:
+            payload = gzip.compress(data)
+        
+        # Write aside and link into place so readers never see partial chunks
+        fd, temp_path = tempfile.mkstemp(dir=chunk_path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.link(temp_path, chunk_path)
+        except FileExistsError:
+            return 0
+        finally:
+            os.unlink(temp_path)
+        
+        return len(payload)
+    
+    def _collect_files(self, source_paths: List[str]) -> List[tuple]:
+        """Enumerate files to back up, honoring exclude patterns.
+        
+        Args:
+            source_paths: List of source paths
+            
+        Returns:
+            List of (file_path, base_dir, arcname, size) tuples
+        """
+        return list(self._iter_files(source_paths))
+    
+    def _iter_files(self, source_paths: List[str]):
+        """Lazily enumerate files to back up, honoring exclude patterns.
+        
+        Args:
+            source_paths: List of source paths
+            
+        Yields:
+            Tuples of (file_path, base_dir, arcname, size)
+        """
+        count = 0
+        report_progress = self.notifier.logger.isEnabledFor(logging.INFO)
+        next_report = time.monotonic() + PROGRESS_INTERVAL
+        
+        for source_path in source_paths:
+            source_obj = Path(source_path)
+            base_dir = os.path.dirname(source_path)
+            
+            if source_obj.is_file():
+                if not self._should_exclude(source_path, source_obj.name):
+                    count += 1
+                    yield source_path, base_dir, source_obj.name, source_obj.stat().st_size
+                    self.notifier.info(f"Added file: {source_path}")
+            
+            elif source_obj.is_dir():
+                for file_path, rel_path, size in self._walk_directory(source_path, base_dir):
+                    count += 1
+                    yield file_path, base_dir, rel_path, size
+                    
+                    # Only look at the clock every 100 files, and format only when due
+                    if report_progress and count % 100 == 0 and time.monotonic() >= next_report:
+                        self.notifier.info(f"Processed {count} files...")
+                        next_report = time.monotonic() + PROGRESS_INTERVAL
+    
+    def _walk_directory(self, directory: str, base_dir: str):
+        """Walk a directory tree yielding files that are not excluded.
+        
+        Uses os.scandir so entry types and sizes come from the cached
+        DirEntry data rather than separate stat calls per file. The compiled
+        _walk extension is used instead when it has been built.
+        
+        Args:
+            directory: Directory to walk
+            base_dir: Directory that archive names are relative to
+            
+        Yields:
+            Tuples of (file_path, arcname, size)
+        """
+        prefix_len = len(os.path.join(base_dir, ''))
+        
+        if _native_walk is not None:
+            yield from _native_walk(
+                directory, prefix_len, self._exclude_re, self._exclude_dirs, self.notifier.warning
+            )
+            return
+        
+        stack = [directory]
+        
+        while stack:
+            path = stack.pop()
+            
+            # Directories that are unreadable or removed mid-walk are skipped
+            try:
+                it = os.scandir(path)
+            except OSError as e:
+                self.notifier.warning(f"Skipping directory {path}: {e}")
+                continue
+            
+            with it:
+                for entry in it:
+                    if self._should_exclude(entry.path, entry.name):
+                        continue
+                    
+                    if entry.is_dir():
+                        # Like os.walk, do not descend into symlinked directories
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    else:
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError as e:
+                            self.notifier.warning(f"Skipping file {entry.path}: {e}")
+                            continue
                         
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            if not self._should_exclude(file_path, exclude_patterns):
-                                # Create relative archive path
-                                rel_path = os.path.relpath(file_path, os.path.dirname(source_path))
-                                tar.add(file_path, arcname=rel_path)
-                                files_count += 1
-                                total_size += os.path.getsize(file_path)
-                                
-                                if files_count % 100 == 0:
-                                    self.notifier.info(f"Processed {files_count} files...")
-        
-        return files_count, total_size
-    
-    def _should_exclude(self, file_path: str, exclude_patterns: List[str]) -> bool:
+                        yield entry.path, entry.path[prefix_len:], size
+    
+    @staticmethod
+    def _compressor_command(compression: str) -> Optional[List[str]]:
+        """Get the multi-threaded external compressor command, if installed.
+        
+        Args:
+            compression: Compression algorithm
+            
+        Returns:
+            Command list, or None if no suitable tool is available
+        """
+        if compression == "gzip" and shutil.which("pigz"):
+            return ["pigz", "-p", str(os.cpu_count() or 1), "-c"]
+        if compression == "zstd" and shutil.which("zstd"):
+            return ["zstd", "-T0", "-q", "-c"]
+        return None
+    
+    @staticmethod
+    def _open_compressed_writer(fileobj, compression: str):
+        """Wrap a binary writer with an in-process compressor.
+        
+        Args:
+            fileobj: Binary file object receiving compressed data
+            compression: Compression algorithm
+            
+        Returns:
+            Writable file object that compresses into fileobj
+        """
+        if compression == "zstd":
+            if zstandard is None:
+                raise ValueError("zstd compression requires the 'zstandard' package or the zstd command")
+            compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+            return compressor.stream_writer(fileobj, closefd=False)
+        
+        return gzip.GzipFile(fileobj=fileobj, mode='wb')
+    
+    def _write_parallel_archive(self, parts: List[List[tuple]], writer: HashingWriter,
+                                compression: str) -> None:
+        """Compress independent sources in parallel worker processes.
+        
+        Each worker writes its members as a separate compressed stream. gzip
+        members and zstd frames concatenate natively, so joining the parts
+        and appending the end-of-archive blocks yields one valid archive.
+        
+        Args:
+            parts: File entries from _collect_files, one list per source
+            writer: Writer receiving the compressed stream
+            compression: Compression algorithm
+        """
+        with tempfile.TemporaryDirectory(dir=self.backup_destination) as temp_dir:
+            part_paths = [os.path.join(temp_dir, f"part{i}") for i in range(len(parts))]
+            
+            max_workers = min(len(parts), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_write_archive_part, parts, part_paths,
+                                  [compression] * len(parts)))
+            
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, writer, TAR_STREAM_BUFSIZE)
+        
+        with self._open_compressed_writer(writer, compression) as stream:
+            stream.write(tarfile.NUL * (2 * tarfile.BLOCKSIZE))
+    
+    def _write_external_archive(self, entries, writer: HashingWriter,
+                                compress_cmd: List[str]) -> tuple:
+        """Write archive by piping GNU tar into an external compressor.
+        
+        File names are written to tar's stdin as entries produces them, so
+        tar starts archiving before the walk has finished.
+        
+        Args:
+            entries: Iterable of file entries from _iter_files
+            writer: Writer receiving the compressed stream
+            compress_cmd: Compressor command reading stdin and writing stdout
+            
+        Returns:
+            Tuple of (files_count, total_size)
+        """
+        tar_cmd = ["tar", "--null", "--no-verbatim-files-from", "--no-recursion", "-T", "-", "-cf", "-"]
+        
+        read_fd, write_fd = os.pipe()
+        compressor = subprocess.Popen(compress_cmd, stdin=read_fd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # tar's stderr goes to a file so warnings can't fill a pipe while we feed stdin
+        tar_err = tempfile.TemporaryFile()
+        tar = subprocess.Popen(tar_cmd, stdin=subprocess.PIPE, stdout=write_fd, stderr=tar_err)
+        os.close(read_fd)
+        os.close(write_fd)
+        
+        totals = [0, 0]
+        feed_errors = []
+        
+        def feed():
+            # tar reads NUL-separated names from stdin; --directory lines switch
+            # the base directory so archive names match the tarfile fallback.
+            current_dir = None
+            try:
+                for _, base_dir, arcname, size in entries:
+                    if base_dir != current_dir:
+                        tar.stdin.write(os.fsencode(f"--directory={base_dir or os.curdir}") + b"\0")
+                        current_dir = base_dir
+                    if arcname.startswith('-'):
+                        arcname = os.path.join(os.curdir, arcname)
+                    tar.stdin.write(os.fsencode(arcname) + b"\0")
+                    totals[0] += 1
+                    totals[1] += size
+            except Exception as e:
+                feed_errors.append(e)
+            finally:
+                try:
+                    tar.stdin.close()
+                except BrokenPipeError:
+                    pass
+        
+        # Walk and feed tar from a helper thread while this thread drains the compressor
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        
+        drained = False
+        try:
+            for chunk in iter(lambda: compressor.stdout.read(1024 * 1024), b""):
+                writer.write(chunk)
+            drained = True
+        finally:
+            if not drained:
+                # Writing the output failed: kill both so the feeder's blocked
+                # write to tar fails and nothing is left waiting on a pipe
+                for process in (tar, compressor):
+                    if process.poll() is None:
+                        process.kill()
+            feeder.join()
+            tar.wait()
+            compressor.stdout.close()
+            compressor_err = compressor.stderr.read()
+            compressor.stderr.close()
+            compressor.wait()
+            
+            with tar_err:
+                tar_err.seek(0)
+                tar_message = tar_err.read().decode(errors='replace').strip()
+        
+        if tar.returncode != 0:
+            raise RuntimeError(f"tar failed: {tar_message}")
+        if feed_errors:
+            raise feed_errors[0]
+        if compressor.returncode != 0:
+            raise RuntimeError(f"{compress_cmd[0]} failed: {compressor_err.decode(errors='replace').strip()}")
+        
+        return totals[0], totals[1]
+    
+    def _write_piped_archive(self, entries: List[tuple], writer: HashingWriter,
+                             compress_cmd: List[str]) -> None:
+        """Write archive with tarfile into an external compressor's stdin.
+        
+        Used when the compressor is installed but GNU tar is not. File bodies
+        are copied into the pipe with sendfile by _SendfileTarFile.
+        
+        Args:
+            entries: File entries from _collect_files
+            writer: Writer receiving the compressed stream
+            compress_cmd: Compressor command reading stdin and writing stdout
+        """
+        compressor = subprocess.Popen(compress_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.PIPE, bufsize=0)
+        
+        # Produce the tar stream from a helper thread while this thread drains the compressor
+        feed_errors = []
+        
+        def feed():
+            try:
+                with _SendfileTarFile(fileobj=_PipeWriter(compressor.stdin), mode='w',
+                                      copybufsize=TAR_STREAM_BUFSIZE) as tar:
+                    for file_path, _, arcname, _ in entries:
+                        tar.add(file_path, arcname=arcname)
+            except Exception as e:
+                feed_errors.append(e)
+            finally:
+                try:
+                    compressor.stdin.close()
+                except BrokenPipeError:
+                    pass
+        
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        
+        drained = False
+        try:
+            for chunk in iter(lambda: compressor.stdout.read(1024 * 1024), b""):
+                writer.write(chunk)
+            drained = True
+        finally:
+            if not drained and compressor.poll() is None:
+                # Writing the output failed: kill the compressor so the
+                # feeder's blocked write fails and the thread can finish
+                compressor.kill()
+            feeder.join()
+            compressor.stdout.close()
+            compressor_err = compressor.stderr.read()
+            compressor.stderr.close()
+            compressor.wait()
+        
+        if feed_errors:
+            raise feed_errors[0]
+        if compressor.returncode != 0:
+            raise RuntimeError(f"{compress_cmd[0]} failed: {compressor_err.decode(errors='replace').strip()}")
+    
+    @staticmethod
+    def _compile_exclude_patterns(exclude_patterns: List[str]) -> tuple:
+        """Compile exclude patterns into a single matcher.
+        
+        Args:
+            exclude_patterns: List of exclude patterns
+            
+        Returns:
+            Tuple of (compiled regex or None, tuple of directory substrings)
+        """
+        patterns = [os.path.normcase(p) for p in exclude_patterns or []]
+        exclude_re = None
+        if patterns:
+            exclude_re = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+        
+        # Patterns ending in '/' also match any path containing that directory
+        exclude_dirs = tuple(p[:-1] for p in patterns if p.endswith('/'))
+        
+        return exclude_re, exclude_dirs
+    
+    def _should_exclude(self, file_path: str, basename: str) -> bool:
         """Check if file should be excluded based on patterns.
         
+        Paths come from resolved sources and os.scandir, so they are already
+        normalized and only need case folding.
+        
         Args:
             file_path: File path to check
-            exclude_patterns: List of exclude patterns
+            basename: Final component of file_path
             
         Returns:
             True if file should be excluded
         """
-        file_path = os.path.normpath(file_path)
+        file_path = os.path.normcase(file_path)
         
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(file_path, pattern) or fnmatch.fnmatch(os.path.basename(file_path), pattern):
-                return True
-            
-            # Check directory patterns
-            if pattern.endswith('/') and pattern[:-1] in file_path:
+        if self._exclude_re is not None:
+            if self._exclude_re.match(file_path) or self._exclude_re.match(os.path.normcase(basename)):
                 return True
         
-        return False
+        return any(d in file_path for d in self._exclude_dirs)
     
     def _save_metadata(self, metadata: Dict[str, Any], metadata_path: Path) -> None:
         """Save backup metadata to file.
@@ -210,16 +774,16 @@ class BackupEngine:
             metadata: Metadata dictionary
             metadata_path: Path to save metadata
         """
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        write_json_atomic(metadata_path, metadata)
         
         self.notifier.info(f"Metadata saved: {metadata_path}")
     
-    def verify_backup(self, backup_filename: str) -> bool:
+    def verify_backup(self, backup_filename: str, quick: bool = False) -> bool:
         """Verify backup integrity using checksum.
         
         Args:
             backup_filename: Name of backup file to verify
+            quick: Only compare the per-chunk CRCs, when the backup has them
             
         Returns:
             True if backup is valid
@@ -237,20 +801,192 @@ class BackupEngine:
         
         try:
             # Load metadata
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            with open(metadata_path, 'rb') as f:
+                metadata = json_loads(f.read())
+            
+            if quick and "chunk_crcs" in metadata:
+                return self._verify_chunk_crcs(backup_filename, backup_path, metadata)
             
             # Calculate current checksum
             current_checksum = calculate_checksum(backup_path, metadata["checksum_algorithm"])
             
             # Compare checksums
-            if current_checksum == metadata["checksum"]:
-                self.notifier.success(f"Backup verification successful: {backup_filename}")
-                return True
-            else:
+            if current_checksum != metadata["checksum"]:
                 self.notifier.failure(f"Backup verification failed: {backup_filename} (checksum mismatch)")
                 return False
+            
+            if metadata.get("mode") == "incremental" and not self._verify_chunks(backup_path):
+                self.notifier.failure(f"Backup verification failed: {backup_filename} (missing chunks)")
+                return False
+            
+            self.notifier.success(f"Backup verification successful: {backup_filename}")
+            return True
                 
         except Exception as e:
             self.notifier.error(f"Backup verification error: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+    def _verify_chunk_crcs(self, backup_filename: str, backup_path: Path,
+                           metadata: Dict[str, Any]) -> bool:
+        """Verify an archive against the per-chunk CRCs in its metadata.
+        
+        Args:
+            backup_filename: Name of backup file to verify
+            backup_path: Path to the backup file
+            metadata: Backup metadata
+            
+        Returns:
+            True if every chunk CRC matches
+        """
+        expected = metadata["chunk_crcs"]
+        current = calculate_chunk_crcs(backup_path, metadata["chunk_size"], metadata["chunk_crc"])
+        
+        if current != expected:
+            bad_chunks = [i for i, (a, b) in enumerate(zip(current, expected)) if a != b]
+            if len(current) != len(expected):
+                detail = f"{len(current)} chunks, expected {len(expected)}"
+            else:
+                detail = f"CRC mismatch in chunks {bad_chunks}"
+            self.notifier.failure(f"Quick backup verification failed: {backup_filename} ({detail})")
+            return False
+        
+        self.notifier.success(f"Quick backup verification successful: {backup_filename}")
+        return True
+    
+    def _verify_chunks(self, manifest_path: Path) -> bool:
+        """Check that every chunk referenced by a manifest is in the store.
+        
+        Args:
+            manifest_path: Path to the manifest file
+            
+        Returns:
+            True if no chunks are missing
+        """
+        with open(manifest_path, 'rb') as f:
+            manifest = json_loads(f.read())
+        
+        chunk_store = self.backup_destination / CHUNK_STORE_DIRNAME
+        extension = CHUNK_EXTENSIONS[manifest["chunk_compression"]]
+        chunk_hashes = {h for entry in manifest["files"] for h in entry["chunks"]}
+        
+        missing = [h for h in chunk_hashes if not (chunk_store / h[:2] / f"{h}{extension}").exists()]
+        for chunk_hash in missing:
+            self.notifier.error(f"Missing chunk: {chunk_hash}")
+        
+        return not missing
+
+
+def _iter_chunks(file_path: str, size: int):
+    """Split a file into chunks for the chunk store.
+    
+    Args:
+        file_path: File to split
+        size: File size in bytes
+        
+    Yields:
+        Chunk data as bytes
+    """
+    if size == 0:
+        return
+    
+    if fastcdc is not None:
+        for chunk in fastcdc(file_path, min_size=CHUNK_MIN_SIZE, avg_size=CHUNK_AVG_SIZE,
+                             max_size=CHUNK_MAX_SIZE, fat=True):
+            yield chunk.data
+        return
+    
+    # Fixed-size fallback: still dedups unchanged files and appended data
+    with open(file_path, 'rb') as f:
+        for data in iter(lambda: f.read(CHUNK_AVG_SIZE), b""):
+            yield data
+
+
+class _PipeWriter:
+    """Unbuffered pipe writer exposing the tell() that TarFile expects."""
+    
+    def __init__(self, pipe):
+        self.pipe = pipe
+    
+    def write(self, data) -> int:
+        self.pipe.write(data)
+        return len(data)
+    
+    def flush(self) -> None:
+        pass
+    
+    def tell(self) -> int:
+        return 0
+    
+    def fileno(self) -> int:
+        return self.pipe.fileno()
+
+
+class _SendfileTarFile(tarfile.TarFile):
+    """TarFile that copies regular file bodies with os.sendfile.
+    
+    Only the header and padding pass through Python; the file data goes
+    from the page cache straight into the output descriptor (e.g. a
+    compressor's stdin pipe). Falls back to the regular copy loop when the
+    platform cannot sendfile into the output.
+    """
+    
+    def addfile(self, tarinfo, fileobj=None):
+        if fileobj is None or not tarinfo.isreg() or not hasattr(os, 'sendfile'):
+            return super().addfile(tarinfo, fileobj)
+        
+        self._check("awx")
+        tarinfo = copy.copy(tarinfo)
+        
+        buf = tarinfo.tobuf(self.format, self.encoding, self.errors)
+        self.fileobj.write(buf)
+        self.offset += len(buf)
+        
+        self._sendfile(fileobj, tarinfo.size)
+        blocks, remainder = divmod(tarinfo.size, tarfile.BLOCKSIZE)
+        if remainder > 0:
+            self.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+            blocks += 1
+        self.offset += blocks * tarfile.BLOCKSIZE
+        
+        self.members.append(tarinfo)
+    
+    def _sendfile(self, fileobj, size: int) -> None:
+        """Copy size bytes of fileobj into the archive output."""
+        self.fileobj.flush()
+        out_fd = self.fileobj.fileno()
+        in_fd = fileobj.fileno()
+        sent = 0
+        
+        while sent < size:
+            try:
+                count = os.sendfile(out_fd, in_fd, sent, size - sent)
+            except OSError:
+                if sent:
+                    raise
+                # Output is not sendfile-capable here; use the Python copy loop
+                tarfile.copyfileobj(fileobj, self.fileobj, size, bufsize=self.copybufsize)
+                return
+            if count == 0:
+                raise tarfile.ReadError("unexpected end of data")
+            sent += count
+
+
+def _write_archive_part(entries: List[tuple], part_path: str, compression: str) -> None:
+    """Write tar members for one source as a standalone compressed stream.
+    
+    Runs in a worker process. The end-of-archive blocks are written once by
+    the parent after all parts are joined.
+    
+    Args:
+        entries: File entries from BackupEngine._collect_files
+        part_path: Path for the compressed part
+        compression: Compression algorithm
+    """
+    with open(part_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as output:
+        with BackupEngine._open_compressed_writer(output, compression) as stream:
+            tar = tarfile.TarFile(fileobj=stream, mode='w', copybufsize=TAR_STREAM_BUFSIZE)
+            for file_path, _, arcname, _ in entries:
+                tar.add(file_path, arcname=arcname)
+            # TarFile.close() is skipped on purpose: it would append the
+            # end-of-archive marker in the middle of the joined archive.
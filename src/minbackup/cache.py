@@ -0,0 +1,157 @@
+"""Persistent cache for slow VM platform queries."""
+
+import os
+import time
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+
+# Seconds a cached query result stays fresh
+DEFAULT_CACHE_TTL = 30
+
+
+def default_cache_path() -> Path:
+    """Get the default cache database location.
+    
+    Returns:
+        Path under $XDG_CACHE_HOME (or ~/.cache) for the cache database
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "minbackup" / "cache.db"
+
+
+class QueryCache:
+    """TTL cache of VM platform query results shared across CLI invocations.
+    
+    Entries live in a small SQLite database, which also serializes access
+    from concurrent invocations. The cache is best-effort: if the database
+    cannot be opened or written, lookups miss and results are not stored.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None, ttl: float = DEFAULT_CACHE_TTL):
+        """Initialize query cache.
+        
+        Args:
+            path: Cache database path (defaults to default_cache_path())
+            ttl: Seconds a cached result stays fresh
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self.ttl = ttl
+        self._conn = None
+        self._disabled = False
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache database on first use."""
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, timeout=5)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, stored_at REAL, value BLOB)"
+                )
+            except (sqlite3.Error, OSError):
+                self._disabled = True
+                self._conn = None
+        return self._conn
+    
+    @staticmethod
+    def _make_key(key: tuple) -> str:
+        return "\0".join(str(part) for part in key)
+    
+    def get(self, key: tuple, default: Any = None) -> Any:
+        """Get a fresh cached value.
+        
+        Args:
+            key: Tuple identifying the query, e.g. ("snapshots", platform, vm_name)
+            default: Value returned on a miss or expired entry
+            
+        Returns:
+            Cached value or default
+        """
+        if self.ttl <= 0:
+            return default
+        
+        conn = self._connect()
+        if conn is None:
+            return default
+        
+        try:
+            row = conn.execute(
+                "SELECT value FROM entries WHERE key = ? AND stored_at >= ?",
+                (self._make_key(key), time.time() - self.ttl)
+            ).fetchone()
+        except sqlite3.Error:
+            return default
+        
+        if row is None:
+            return default
+        
+        # Rows written by another version may no longer unpickle
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            return default
+    
+    def set(self, key: tuple, value: Any) -> None:
+        """Store a value.
+        
+        Args:
+            key: Tuple identifying the query
+            value: Picklable query result
+        """
+        conn = self._connect()
+        if conn is None:
+            return
+        
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    (self._make_key(key), time.time(), pickle.dumps(value))
+                )
+        except sqlite3.Error:
+            pass
+    
+    def get_or_compute(self, key: tuple, compute: Callable[[], Any], refresh: bool = False) -> Any:
+        """Get a cached value, computing and storing it on a miss.
+        
+        Args:
+            key: Tuple identifying the query
+            compute: Callable producing the value
+            refresh: Ignore any cached value and recompute
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        missing = object()
+        value = missing if refresh else self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.set(key, value)
+        return value
+    
+    def clear(self) -> None:
+        """Drop all cached entries, e.g. after snapshots were created or deleted."""
+        conn = self._connect()
+        if conn is None:
+            return
+        
+        try:
+            with conn:
+                conn.execute("DELETE FROM entries")
+        except sqlite3.Error:
+            pass
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __enter__(self) -> "QueryCache":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1,23 +1,79 @@
 """Command-line interface for MinBackup - VM Snapshot Management Only."""
 
 import os
+import re
 import sys
 import click
-import json
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from .config import Config
-from .vm_manager import VMManager
-from .utils import NotificationManager
-from .scheduler import SnapshotScheduler
+from .utils import (
+    NotificationManager, json_loads, json_dump, get_directory_size,
+    AUTO_SNAPSHOT_PREFIXES, MINBACKUP_SNAPSHOT_PREFIXES,
+)
+
+# VMManager, QueryCache and the scheduler are imported inside the commands
+# that use them, so `--help` and unrelated commands skip their import cost
 
 
 # Global configuration
 config = None
 notifier = None
 
+# Compact `snapshots` table rows: #, type, name, created[, estimated size]
+SNAPSHOT_ROW_FMT = "{:<3} {:<4} {:<25} {:<20}"
+SNAPSHOT_SIZE_ROW_FMT = "{:<3} {:<4} {:<20} {:<20} {:<10}"
+
+# Concurrent VM platform queries made by `status`
+STATUS_QUERY_WORKERS = 16
+
+# Example configurations shipped in the repository's config/examples
+EXAMPLE_CONFIG_DIR = Path(__file__).resolve().parents[2] / "config" / "examples"
+
+# Status icons, with ASCII prefixes for terminals without Unicode
+STATUS_ICONS = {
+    "success": "✅",
+    "error": "❌", 
+    "warning": "⚠️",
+    "info": "ℹ️",
+    "vm": "🖥️",
+    "cleanup": "🧹",
+    "delete": "🗑️",
+    "snapshot": "📸"
+}
+
+STATUS_PREFIXES = {
+    "success": "[OK]",
+    "error": "[ERROR]",
+    "warning": "[WARN]",
+    "info": "[INFO]",
+    "vm": "[VM]",
+    "cleanup": "[CLEANUP]",
+    "delete": "[DELETE]",
+    "snapshot": "[SNAPSHOT]"
+}
+
+# `vboxmanage list --long vms` starts each VM block with a "Name:" line
+VBOX_NAME_SPLIT_RE = re.compile(r'^Name:[ \t]+', re.MULTILINE)
+VBOX_CONFIG_FILE_RE = re.compile(r'^Config file:[ \t]+(.+)$', re.MULTILINE)
+
+
+@dataclass
+class VMDetail:
+    """Per-VM row of the status report."""
+    __slots__ = ("name", "platform", "state", "snapshot_count", "minbackup_snapshots")
+    
+    name: str
+    platform: str
+    state: str
+    snapshot_count: int
+    minbackup_snapshots: int
+
 
 def get_unicode_support() -> bool:
     """Check if Unicode is supported in the current terminal."""
@@ -28,44 +84,67 @@ def get_unicode_support() -> bool:
         return False
 
 
+# The terminal encoding does not change during a run, so probe it once at import
+UNICODE_OK = get_unicode_support()
+
+
 def format_status_icon(status: str) -> str:
     """Format status with appropriate icon."""
-    if get_unicode_support():
-        icons = {
-            "success": "✅",
-            "error": "❌", 
-            "warning": "⚠️",
-            "info": "ℹ️",
-            "vm": "🖥️",
-            "cleanup": "🧹",
-            "delete": "🗑️",
-            "snapshot": "📸"
-        }
-        return icons.get(status, "")
-    else:
-        prefixes = {
-            "success": "[OK]",
-            "error": "[ERROR]",
-            "warning": "[WARN]",
-            "info": "[INFO]",
-            "vm": "[VM]",
-            "cleanup": "[CLEANUP]",
-            "delete": "[DELETE]",
-            "snapshot": "[SNAPSHOT]"
-        }
-        return prefixes.get(status, "")
+    return (STATUS_ICONS if UNICODE_OK else STATUS_PREFIXES).get(status, "")
+
+
+# Icons are fixed for the run, so resolve them once
+_ICON_SUCCESS = format_status_icon('success')
+_ICON_ERROR = format_status_icon('error')
+_ICON_WARNING = format_status_icon('warning')
+_ICON_INFO = format_status_icon('info')
+_ICON_VM = format_status_icon('vm')
+_ICON_CLEANUP = format_status_icon('cleanup')
+_ICON_DELETE = format_status_icon('delete')
+_ICON_SNAPSHOT = format_status_icon('snapshot')
+
 
+DATETIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%f",  # ISO format with microseconds
+    "%Y-%m-%dT%H:%M:%S",     # ISO format
+    "%Y-%m-%d %H:%M:%S",     # Standard format
+    "%Y%m%d-%H%M%S",         # Timestamp format
+]
 
+
+def _dispatch_datetime_format(date_str: str) -> Optional[str]:
+    """Pick the likely datetime format from the shape of the string."""
+    if 'T' in date_str:
+        return DATETIME_FORMATS[0] if '.' in date_str else DATETIME_FORMATS[1]
+    if ' ' in date_str:
+        return DATETIME_FORMATS[2]
+    if len(date_str) == 15 and date_str[8:9] == '-':
+        return DATETIME_FORMATS[3]
+    return None
+
+
+@lru_cache(maxsize=4096)
 def parse_datetime(date_str: str) -> datetime:
     """Parse datetime string in various formats."""
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%f",  # ISO format with microseconds
-        "%Y-%m-%dT%H:%M:%S",     # ISO format
-        "%Y-%m-%d %H:%M:%S",     # Standard format
-        "%Y%m%d-%H%M%S",         # Timestamp format
-    ]
-    
-    for fmt in formats:
+    # Fast path: ISO timestamps dominate and fromisoformat parses them in C
+    if len(date_str) >= 19 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            dt = datetime.fromisoformat(date_str)
+            # Aware values would not compare with the naive ones used for sorting
+            if dt.tzinfo is None:
+                return dt
+        except ValueError:
+            pass
+    
+    fmt = _dispatch_datetime_format(date_str)
+    if fmt:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            pass
+    
+    # Unrecognized shape: try every format
+    for fmt in DATETIME_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -74,6 +153,20 @@ def parse_datetime(date_str: str) -> datetime:
     return datetime.min
 
 
+def snapshot_sort_key(snapshot: dict) -> datetime:
+    """Sort key by creation time; snapshots without one sort as oldest."""
+    created_at = snapshot.get('created_at')
+    return parse_datetime(created_at) if created_at else datetime.min
+
+
+def sort_snapshots_by_date(snapshots: list) -> list:
+    """Return snapshots newest first, parsing each creation time once."""
+    keyed = [(snapshot_sort_key(snapshot), snapshot) for snapshot in snapshots]
+    keyed.sort(key=itemgetter(0), reverse=True)
+    return [snapshot for _, snapshot in keyed]
+
+
+@lru_cache(maxsize=4096)
 def extract_clean_timestamp(created_str: str) -> str:
     """Extract clean timestamp from snapshot created string."""
     if not created_str or created_str == "unknown":
@@ -90,7 +183,7 @@ def extract_clean_timestamp(created_str: str) -> str:
             # Try to parse and reformat
             dt = datetime.fromisoformat(timestamp_part.replace("â€¦", ""))
             return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
+        except (ValueError, TypeError):
             # Fallback: just extract the visible part
             timestamp_part = created_str.split("at ")[-1]
             if len(timestamp_part) > 19:
@@ -102,7 +195,7 @@ def extract_clean_timestamp(created_str: str) -> str:
         try:
             dt = datetime.fromisoformat(created_str.replace("â€¦", ""))
             return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
+        except (ValueError, TypeError):
             # Fallback: just show first 19 characters
             return created_str[:19].replace("T", " ")
     
@@ -113,18 +206,46 @@ def extract_clean_timestamp(created_str: str) -> str:
     return created_str
 
 
+# `multipass info` results fetched during this run, keyed by VM name
+_multipass_info = {}
+
+
+def _multipass_info_all(vm_names: list) -> dict:
+    """Fetch `multipass info` for several VMs with a single call.
+    
+    Results are remembered for the rest of the run, so later per-VM
+    lookups do not spawn another multipass process.
+    
+    Args:
+        vm_names: Multipass instance names
+        
+    Returns:
+        Mapping of VM name to its info dictionary
+    """
+    import subprocess
+    try:
+        result = subprocess.run(
+            ["multipass", "info", *vm_names, "--format", "json"],
+            capture_output=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    
+    if result.returncode == 0:
+        # Parse the raw bytes; orjson needs no text decoding pass
+        _multipass_info.update(json_loads(result.stdout).get("info", {}))
+    
+    return {name: _multipass_info[name] for name in vm_names if name in _multipass_info}
+
+
 def get_vm_size_estimate(vm_name: str, platform_name: str) -> str:
     """Get estimated VM size."""
     try:
         if platform_name == "multipass":
-            import subprocess
-            result = subprocess.run(
-                ["multipass", "info", vm_name, "--format", "json"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                vm_info = data.get("info", {}).get(vm_name, {})
+            vm_info = _multipass_info.get(vm_name)
+            if vm_info is None:
+                vm_info = _multipass_info_all([vm_name]).get(vm_name)
+            if vm_info:
                 disk_usage = vm_info.get("disk_usage", "unknown")
                 if disk_usage and disk_usage != "unknown":
                     return disk_usage
@@ -135,92 +256,94 @@ def get_vm_size_estimate(vm_name: str, platform_name: str) -> str:
                         return str(vm_info[field])
         
         elif platform_name == "virtualbox":
-            import subprocess
-            # Get VM UUID first
-            list_result = subprocess.run(
-                ["vboxmanage", "list", "vms"],
-                capture_output=True, text=True, timeout=10
-            )
-            if list_result.returncode == 0:
-                for line in list_result.stdout.split('\n'):
-                    if f'"{vm_name}"' in line:
-                        # Extract UUID
-                        import re
-                        match = re.search(r'\{([^}]+)\}', line)
-                        if match:
-                            uuid = match.group(1)
-                            # Get VM info
-                            info_result = subprocess.run(
-                                ["vboxmanage", "showvminfo", uuid, "--machinereadable"],
-                                capture_output=True, text=True, timeout=10
-                            )
-                            if info_result.returncode == 0:
-                                for info_line in info_result.stdout.split('\n'):
-                                    if info_line.startswith('CfgFile='):
-                                        cfg_path = info_line.split('=')[1].strip('"')
-                                        try:
-                                            cfg_dir = os.path.dirname(cfg_path)
-                                            total_size = 0
-                                            for root, dirs, files in os.walk(cfg_dir):
-                                                for file in files:
-                                                    file_path = os.path.join(root, file)
-                                                    if os.path.exists(file_path):
-                                                        total_size += os.path.getsize(file_path)
-                                            
-                                            # Convert to human readable
-                                            if total_size > 1024**3:
-                                                return f"{total_size / (1024**3):.1f}GB"
-                                            elif total_size > 1024**2:
-                                                return f"{total_size / (1024**2):.1f}MB"
-                                            else:
-                                                return f"{total_size / 1024:.1f}KB"
-                                        except:
-                                            pass
-                            break
+            cfg_path = get_vbox_config_files().get(vm_name)
+            if cfg_path:
+                try:
+                    total_size = get_directory_size(os.path.dirname(cfg_path))
+                    
+                    # Convert to human readable
+                    if total_size > 1024**3:
+                        return f"{total_size / (1024**3):.1f}GB"
+                    elif total_size > 1024**2:
+                        return f"{total_size / (1024**2):.1f}MB"
+                    else:
+                        return f"{total_size / 1024:.1f}KB"
+                except OSError:
+                    pass
         
         return "unknown"
     except Exception:
         return "unknown"
 
 
-def get_snapshot_size_estimate(vm_name: str, snapshot_name: str, platform_name: str) -> str:
-    """Get estimated snapshot size (experimental)."""
+@lru_cache(maxsize=1)
+def get_vbox_config_files() -> dict:
+    """Map VirtualBox VM names to their config file paths.
+    
+    Runs a single `vboxmanage list --long vms` per invocation instead of
+    `list vms` plus `showvminfo` for every VM.
+    """
+    import subprocess
+    try:
+        result = subprocess.run(
+            ["vboxmanage", "list", "--long", "vms"],
+            capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    
+    config_files = {}
+    if result.returncode == 0:
+        for block in VBOX_NAME_SPLIT_RE.split(result.stdout)[1:]:
+            name, _, details = block.partition('\n')
+            match = VBOX_CONFIG_FILE_RE.search(details)
+            if match:
+                # Later "Name:" lines (e.g. shared folders) carry no config file
+                config_files.setdefault(name.strip(), match.group(1).strip())
+    
+    return config_files
+
+
+def get_snapshot_size_estimate(vm_size: str) -> str:
+    """Get estimated snapshot size (experimental).
+    
+    Snapshots are typically incremental, so they are estimated from the VM
+    size; callers compute that once per VM rather than once per snapshot.
+    """
     try:
-        if platform_name == "multipass":
-            # For Multipass, snapshots are typically incremental
-            # We can estimate based on VM size, but actual snapshot size varies
-            vm_size = get_vm_size_estimate(vm_name, platform_name)
-            if vm_size != "unknown" and vm_size:
-                # Estimate snapshot as 10-30% of VM size (very rough estimate)
-                try:
-                    if "GB" in vm_size:
-                        size_num = float(vm_size.replace("GB", ""))
-                        estimated = size_num * 0.2  # 20% estimate
-                        if estimated > 1:
-                            return f"~{estimated:.1f}GB"
-                        else:
-                            return f"~{estimated * 1024:.0f}MB"
-                    elif "MB" in vm_size:
-                        size_num = float(vm_size.replace("MB", ""))
-                        estimated = size_num * 0.2
-                        return f"~{estimated:.0f}MB"
-                except:
-                    pass
-            
-            return "~unknown"
+        if vm_size != "unknown" and vm_size:
+            # Estimate snapshot as 10-30% of VM size (very rough estimate)
+            if "GB" in vm_size:
+                size_num = float(vm_size.replace("GB", ""))
+                estimated = size_num * 0.2  # 20% estimate
+                if estimated > 1:
+                    return f"~{estimated:.1f}GB"
+                else:
+                    return f"~{estimated * 1024:.0f}MB"
+            elif "MB" in vm_size:
+                size_num = float(vm_size.replace("MB", ""))
+                estimated = size_num * 0.2
+                return f"~{estimated:.0f}MB"
         
         return "~unknown"
-    except:
+    except (ValueError, TypeError, AttributeError):
         return "~unknown"
 
 
-def initialize_config(config_file: Optional[str] = None) -> tuple:
+def get_query_cache(config_obj: Config) -> "QueryCache":
+    """Open the on-disk cache of VM sizes and snapshot listings."""
+    from .cache import QueryCache, DEFAULT_CACHE_TTL
+    return QueryCache(config_obj.get('cache.path'), ttl=config_obj.get('cache.ttl', DEFAULT_CACHE_TTL))
+
+
+def initialize_config(config_file: Optional[str] = None, verbose: bool = False) -> tuple:
     """Initialize configuration and notification manager."""
     global config, notifier
     
     try:
         config = Config(config_file)
-        notifier = NotificationManager(config)
+        # Verbose is a runtime override: it must not end up in a saved config
+        notifier = NotificationManager(config, level='DEBUG' if verbose else None)
         return config, notifier
     except Exception as e:
         click.echo(f"Error: Failed to initialize configuration: {str(e)}", err=True)
@@ -240,13 +363,8 @@ def cli(ctx, config: Optional[str], verbose: bool):
     """
     ctx.ensure_object(dict)
     
-    # Initialize configuration
-    global_config, global_notifier = initialize_config(config)
-    
-    # Set verbose mode
-    if verbose:
-        global_config.set('notifications.level', 'DEBUG')
-        global_notifier = NotificationManager(global_config)
+    # Initialize configuration, in verbose mode if requested
+    global_config, global_notifier = initialize_config(config, verbose)
     
     # Store in context for subcommands
     ctx.obj['config'] = global_config
@@ -268,13 +386,15 @@ def init(ctx, example: Optional[str]):
         if example:
             config_file = f"minbackup-{example}.yaml"
             # Load example configuration if available
-            example_config_path = Path(__file__).parent.parent.parent / "config" / "examples" / f"{example}.yaml"
-            if example_config_path.exists():
-                import yaml
+            example_config_path = EXAMPLE_CONFIG_DIR / f"{example}.yaml"
+            import yaml
+            try:
                 with open(example_config_path, 'r') as f:
                     example_config = yaml.safe_load(f)
-                for key, value in example_config.items():
-                    config_obj._config[key] = value
+            except FileNotFoundError:
+                example_config = None
+            if example_config:
+                config_obj.merge(example_config)
         
         config_obj.save(config_file)
         
@@ -282,9 +402,10 @@ def init(ctx, example: Optional[str]):
         click.echo(f"Configuration saved to: {config_file}")
         
         # Check VM platforms
-        vm_manager = VMManager(config_obj, notifier_obj)
-        if vm_manager.available_platforms:
-            click.echo(f"Available VM platforms: {', '.join(vm_manager.available_platforms.keys())}")
+        from .vm_manager import VMManager
+        platforms = VMManager.detect_platforms(config_obj)
+        if platforms:
+            click.echo(f"Available VM platforms: {', '.join(platforms)}")
         else:
             click.echo("No VM platforms detected. Install multipass, VirtualBox, or VMware for VM snapshot support.")
         
@@ -296,69 +417,134 @@ def init(ctx, example: Optional[str]):
 @cli.command('list')
 @click.option('--platform', '-p', help='Specific VM platform')
 @click.option('--show-sizes', is_flag=True, help='Show VM disk usage')
+@click.option('--refresh', is_flag=True, help='Ignore cached VM sizes and snapshot listings')
 @click.pass_context
-def vm_list(ctx, platform: Optional[str], show_sizes: bool):
+def vm_list(ctx, platform: Optional[str], show_sizes: bool, refresh: bool):
     """List all VMs and their snapshots with sizes."""
     config_obj = ctx.obj['config']
     notifier_obj = ctx.obj['notifier']
+    cache = get_query_cache(config_obj)
+    
+    # Listing lines are collected and written with a single echo
+    output = []
     
     try:
+        from .vm_manager import VMManager
         vm_manager = VMManager(config_obj, notifier_obj)
         
         if not vm_manager.available_platforms:
             click.echo("No VM platforms available.")
             return
         
-        click.echo(f"\n{format_status_icon('vm')} Virtual Machines & Snapshots")
-        click.echo("=" * 80)
+        output.append(f"\n{_ICON_VM} Virtual Machines & Snapshots")
+        output.append("=" * 80)
         
         all_vms = vm_manager.list_all_vms()
         
+        # Snapshot listings are subprocess calls: serve recent ones from the
+        # cache and run the rest concurrently up front
+        jobs = [
+            (vm['name'], platform_name)
+            for platform_name, vms in all_vms.items()
+            if not platform or platform == platform_name
+            for vm in vms
+        ]
+        cached_snapshots = {}
+        if not refresh:
+            for job in jobs:
+                snapshots = cache.get(("snapshots",) + job)
+                if snapshots is not None:
+                    cached_snapshots[job] = snapshots
+        pending = [job for job in jobs if job not in cached_snapshots]
+        snapshot_futures = {}
+        # Platforms that list every VM's snapshots in one command get a single query
+        batched = {}
+        for vm_name, platform_name in pending:
+            if vm_manager.available_platforms[platform_name].batch_snapshot_listing:
+                batched.setdefault(platform_name, []).append(vm_name)
+        batch_futures = {}
+        if pending:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+                for platform_name, vm_names in batched.items():
+                    batch_futures[platform_name] = executor.submit(
+                        vm_manager.list_all_snapshots, platform_name, vm_names
+                    )
+                for job in pending:
+                    if job[1] not in batched:
+                        snapshot_futures[job] = executor.submit(vm_manager.list_snapshots, *job)
+        
+        # Size every uncached Multipass VM with one `multipass info` call
+        if show_sizes and (not platform or platform == "multipass"):
+            uncached = [
+                vm['name'] for vm in all_vms.get("multipass", [])
+                if refresh or cache.get(("size", vm['name'], "multipass")) is None
+            ]
+            if uncached:
+                _multipass_info_all(uncached)
+        
+        # Reuse the listings for the summary
+        snapshot_cache = {}
+        
         for platform_name, vms in all_vms.items():
             if platform and platform != platform_name:
                 continue
                 
-            click.echo(f"\n{platform_name.upper()}:")
+            output.append(f"\n{platform_name.upper()}:")
             if not vms:
-                click.echo("  No VMs found")
+                output.append("  No VMs found")
                 continue
             
             for vm in vms:
-                vm_icon = "[VM]" if not get_unicode_support() else "📱"
+                vm_icon = "[VM]" if not UNICODE_OK else "📱"
                 vm_line = f"  {vm_icon} {vm['name']} ({vm.get('state', 'unknown')})"
                 
                 # Add VM size if requested
                 if show_sizes:
-                    vm_size = get_vm_size_estimate(vm['name'], platform_name)
+                    vm_size = cache.get_or_compute(
+                        ("size", vm['name'], platform_name),
+                        lambda: get_vm_size_estimate(vm['name'], platform_name),
+                        refresh
+                    )
                     vm_line += f" - Size: {vm_size}"
                 
-                click.echo(vm_line)
+                output.append(vm_line)
                 
                 # List snapshots
                 try:
-                    snapshots = vm_manager.list_snapshots(vm['name'], platform_name)
+                    job = (vm['name'], platform_name)
+                    snapshots = cached_snapshots.get(job)
+                    if snapshots is None:
+                        # Cache writes stay on this thread; the connection is not shared
+                        if platform_name in batch_futures:
+                            snapshots = batch_futures[platform_name].result()[vm['name']]
+                        else:
+                            snapshots = snapshot_futures[job].result()
+                        cache.set(("snapshots",) + job, snapshots)
+                    snapshot_cache[job] = snapshots
                     if snapshots:
-                        click.echo(f"     📸 Snapshots: {len(snapshots)}")
+                        output.append(f"     📸 Snapshots: {len(snapshots)}")
                         
                         # Sort snapshots by date (newest first)
-                        snapshots.sort(key=lambda x: parse_datetime(x.get('created_at', '')), reverse=True)
+                        snapshots = sort_snapshots_by_date(snapshots)
                         
                         for i, snapshot in enumerate(snapshots[:5]):  # Show first 5
                             created = extract_clean_timestamp(snapshot.get('created_at', 'unknown'))
                             
+                            snapshot_name = snapshot['name']
                             prefix = "       -"
-                            if snapshot['name'].startswith('minbackup') or snapshot['name'].startswith('backup'):
+                            if snapshot_name.startswith(MINBACKUP_SNAPSHOT_PREFIXES):
                                 prefix = "       📦"  # MinBackup snapshot
                             
-                            click.echo(f"{prefix} {snapshot['name']} ({created})")
+                            output.append(f"{prefix} {snapshot_name} ({created})")
                         
                         if len(snapshots) > 5:
-                            click.echo(f"       ... and {len(snapshots) - 5} more")
+                            output.append(f"       ... and {len(snapshots) - 5} more")
                     else:
-                        click.echo("     No snapshots")
+                        output.append("     No snapshots")
                         
                 except Exception as e:
-                    click.echo(f"     Snapshots: error - {str(e)}")
+                    output.append(f"     Snapshots: error - {str(e)}")
         
         # Summary
         total_vms = sum(len(vms) for vms in all_vms.values())
@@ -366,16 +552,23 @@ def vm_list(ctx, platform: Optional[str], show_sizes: bool):
         for platform_name, platform in vm_manager.available_platforms.items():
             for vm in all_vms.get(platform_name, []):
                 try:
-                    snapshots = vm_manager.list_snapshots(vm['name'], platform_name)
+                    snapshots = snapshot_cache.get((vm['name'], platform_name))
+                    if snapshots is None:
+                        snapshots = vm_manager.list_snapshots(vm['name'], platform_name)
                     total_snapshots += len(snapshots)
-                except:
+                except Exception:
                     pass
         
-        click.echo(f"\n{format_status_icon('info')} Summary: {total_vms} VMs, {total_snapshots} snapshots")
+        output.append(f"\n{_ICON_INFO} Summary: {total_vms} VMs, {total_snapshots} snapshots")
+        click.echo("\n".join(output))
         
     except Exception as e:
+        if output:
+            click.echo("\n".join(output))
         notifier_obj.error(f"Failed to list VMs: {str(e)}")
         sys.exit(1)
+    finally:
+        cache.close()
 
 
 @cli.command('snapshots')
@@ -387,16 +580,26 @@ def vm_list(ctx, platform: Optional[str], show_sizes: bool):
 @click.option('--format', '-f', type=click.Choice(['table', 'json']), default='table',
               help='Output format')
 @click.option('--show-sizes', is_flag=True, help='Show estimated snapshot sizes')
+@click.option('--refresh', is_flag=True, help='Ignore cached snapshot listings')
 @click.pass_context
 def vm_snapshots(ctx, vm_name: str, platform: Optional[str], sort: str, details: bool, 
-                format: str, show_sizes: bool):
+                format: str, show_sizes: bool, refresh: bool):
     """List snapshots for a specific VM with advanced options."""
     config_obj = ctx.obj['config']
     notifier_obj = ctx.obj['notifier']
+    cache = get_query_cache(config_obj)
+    
+    # Listing lines are collected and written with a single echo
+    output = []
     
     try:
+        from .vm_manager import VMManager
         vm_manager = VMManager(config_obj, notifier_obj)
-        snapshots = vm_manager.list_snapshots(vm_name, platform)
+        snapshots = cache.get_or_compute(
+            ("snapshots", vm_name, platform),
+            lambda: vm_manager.list_snapshots(vm_name, platform),
+            refresh
+        )
         
         if not snapshots:
             click.echo(f"No snapshots found for VM: {vm_name}")
@@ -409,92 +612,118 @@ def vm_snapshots(ctx, vm_name: str, platform: Optional[str], sort: str, details:
             if platform_obj:
                 platform_name = platform_obj.platform_name
         
+        # Snapshot estimates derive from the VM size, which is the same for every row
+        vm_size = "unknown"
+        if show_sizes and platform_name == "multipass":
+            vm_size = cache.get_or_compute(
+                ("size", vm_name, platform_name),
+                lambda: get_vm_size_estimate(vm_name, platform_name),
+                refresh
+            )
+        
         # Sort snapshots
         if sort == 'date':
-            snapshots.sort(key=lambda x: parse_datetime(x.get('created_at', '')), reverse=True)
+            snapshots = sort_snapshots_by_date(snapshots)
         else:  # sort by name
             snapshots.sort(key=lambda x: x.get('name', ''))
         
         if format == 'json':
-            click.echo(json.dumps(snapshots, indent=2))
+            json_dump(snapshots, sys.stdout)
             return
         
         # Table format
-        click.echo(f"\n{format_status_icon('snapshot')} Snapshots for VM: {vm_name}")
-        click.echo("=" * 90)
+        output.append(f"\n{_ICON_SNAPSHOT} Snapshots for VM: {vm_name}")
+        output.append("=" * 90)
+        
+        # Type counts are gathered while rendering instead of re-scanning afterwards
+        auto_count = 0
+        minbackup_count = 0
         
         if details:
             for i, snapshot in enumerate(snapshots, 1):
+                snapshot_name = snapshot['name']
+                
                 # Updated icon logic for three types
-                if snapshot['name'].startswith('auto'):
+                if snapshot_name.startswith(AUTO_SNAPSHOT_PREFIXES):
                     icon = "🤖"  # Robot for automatic
                     snap_type_full = "Automatic"
-                elif snapshot['name'].startswith(('minbackup', 'backup')):
+                    auto_count += 1
+                elif snapshot_name.startswith(MINBACKUP_SNAPSHOT_PREFIXES):
                     icon = "📦"  # Box for MinBackup
                     snap_type_full = "MinBackup"
+                    minbackup_count += 1
                 else:
                     icon = "📸"  # Camera for manual
                     snap_type_full = "Manual"
                 
-                click.echo(f"\n{i}. {icon} {snapshot['name']}")
+                output.append(f"\n{i}. {icon} {snapshot_name}")
                 
                 created = extract_clean_timestamp(snapshot.get('created_at', 'unknown'))
-                click.echo(f"   Created: {created}")
-                click.echo(f"   Platform: {snapshot.get('platform', 'unknown')}")
-                click.echo(f"   Type: {snap_type_full}")
+                output.append(f"   Created: {created}")
+                output.append(f"   Platform: {snapshot.get('platform', 'unknown')}")
+                output.append(f"   Type: {snap_type_full}")
                 
                 if show_sizes and platform_name:
-                    size_est = get_snapshot_size_estimate(vm_name, snapshot['name'], platform_name)
-                    click.echo(f"   Est. Size: {size_est}")
+                    size_est = get_snapshot_size_estimate(vm_size)
+                    output.append(f"   Est. Size: {size_est}")
         else:
             # Compact table format
             if show_sizes:
-                header = f"{'#':<3} {'Type':<4} {'Name':<20} {'Created':<20} {'Est. Size':<10}"
+                header = SNAPSHOT_SIZE_ROW_FMT.format('#', 'Type', 'Name', 'Created', 'Est. Size')
                 separator = "-" * 90
             else:
-                header = f"{'#':<3} {'Type':<4} {'Name':<25} {'Created':<20}"
+                header = SNAPSHOT_ROW_FMT.format('#', 'Type', 'Name', 'Created')
                 separator = "-" * 70
             
-            click.echo(header)
-            click.echo(separator)
+            output.append(header)
+            output.append(separator)
+            
+            # Every row shares the VM-derived estimate, so format it once
+            size_est = get_snapshot_size_estimate(vm_size)[:9] if show_sizes and platform_name else None
             
             for i, snapshot in enumerate(snapshots, 1):
+                snapshot_name = snapshot['name']
+                
                 # Updated type logic for three types
-                if snapshot['name'].startswith('auto'):
+                if snapshot_name.startswith(AUTO_SNAPSHOT_PREFIXES):
                     snap_type = "AUTO"
-                elif snapshot['name'].startswith(('minbackup', 'backup')):
+                    auto_count += 1
+                elif snapshot_name.startswith(MINBACKUP_SNAPSHOT_PREFIXES):
                     snap_type = "MB"
+                    minbackup_count += 1
                 else:
                     snap_type = "MAN"
                 
-                name = snapshot['name'][:19] if show_sizes else snapshot['name'][:24]
-                created = extract_clean_timestamp(snapshot.get('created_at', 'unknown'))[:19]
+                # extract_clean_timestamp never returns more than 19 characters
+                created = extract_clean_timestamp(snapshot.get('created_at', 'unknown'))
                 
-                if show_sizes and platform_name:
-                    size_est = get_snapshot_size_estimate(vm_name, snapshot['name'], platform_name)[:9]
-                    row = f"{i:<3} {snap_type:<4} {name:<20} {created:<20} {size_est:<10}"
+                if size_est is not None:
+                    output.append(SNAPSHOT_SIZE_ROW_FMT.format(i, snap_type, snapshot_name[:19], created, size_est))
                 else:
-                    row = f"{i:<3} {snap_type:<4} {name:<25} {created:<20}"
-                
-                click.echo(row)
+                    name = snapshot_name[:19] if show_sizes else snapshot_name[:24]
+                    output.append(SNAPSHOT_ROW_FMT.format(i, snap_type, name, created))
         
-        click.echo(f"\nTotal snapshots: {len(snapshots)}")
+        output.append(f"\nTotal snapshots: {len(snapshots)}")
         
         # Updated counts for three types
-        auto_count = len([s for s in snapshots if s['name'].startswith('auto')])
-        minbackup_count = len([s for s in snapshots if s['name'].startswith(('minbackup', 'backup'))])
         manual_count = len(snapshots) - auto_count - minbackup_count
         
-        click.echo(f"Automatic snapshots: {auto_count}")
-        click.echo(f"MinBackup snapshots: {minbackup_count}")
-        click.echo(f"Manual snapshots: {manual_count}")
+        output.append(f"Automatic snapshots: {auto_count}")
+        output.append(f"MinBackup snapshots: {minbackup_count}")
+        output.append(f"Manual snapshots: {manual_count}")
         
         if show_sizes:
-            click.echo("\nNote: Snapshot sizes are estimates and may not reflect actual disk usage.")
+            output.append("\nNote: Snapshot sizes are estimates and may not reflect actual disk usage.")
+        
+        click.echo("\n".join(output))
         
     except Exception as e:
+        if output:
+            click.echo("\n".join(output))
         notifier_obj.error(f"Failed to list snapshots: {str(e)}")
         sys.exit(1)
+    finally:
+        cache.close()
 
 @cli.command('snapshot')
 @click.argument('vm_name')
@@ -507,14 +736,17 @@ def vm_snapshot(ctx, vm_name: str, platform: Optional[str], name: Optional[str])
     notifier_obj = ctx.obj['notifier']
     
     try:
+        from .vm_manager import VMManager
         vm_manager = VMManager(config_obj, notifier_obj)
         
         success = vm_manager.create_snapshot(vm_name, platform, name)
+        with get_query_cache(config_obj) as cache:
+            cache.clear()
         
         if success:
-            click.echo(f"{format_status_icon('success')} Snapshot created for VM: {vm_name}")
+            click.echo(f"{_ICON_SUCCESS} Snapshot created for VM: {vm_name}")
         else:
-            click.echo(f"{format_status_icon('error')} Failed to create snapshot for VM: {vm_name}")
+            click.echo(f"{_ICON_ERROR} Failed to create snapshot for VM: {vm_name}")
             sys.exit(1)
             
     except Exception as e:
@@ -536,6 +768,7 @@ def vm_delete_snapshot(ctx, vm_name: str, snapshot_names: tuple, platform: Optio
     notifier_obj = ctx.obj['notifier']
     
     try:
+        from .vm_manager import VMManager
         vm_manager = VMManager(config_obj, notifier_obj)
         
         # Handle special keywords
@@ -548,10 +781,11 @@ def vm_delete_snapshot(ctx, vm_name: str, snapshot_names: tuple, platform: Optio
                 return
             
             # Show what will be deleted
-            click.echo(f"\n{format_status_icon('delete')} ALL snapshots to delete from VM '{vm_name}':")
+            output = [f"\n{_ICON_DELETE} ALL snapshots to delete from VM '{vm_name}':"]
             for snapshot in existing_snapshots:
                 created = extract_clean_timestamp(snapshot.get('created_at', 'unknown'))
-                click.echo(f"  - {snapshot['name']} (created: {created})")
+                output.append(f"  - {snapshot['name']} (created: {created})")
+            click.echo("\n".join(output))
             
             # Confirm deletion
             if not confirm:
@@ -561,30 +795,33 @@ def vm_delete_snapshot(ctx, vm_name: str, snapshot_names: tuple, platform: Optio
             
             # Delete all snapshots
             deleted_count = vm_manager.delete_all_snapshots(vm_name, platform, not no_purge)
-            click.echo(f"\n{format_status_icon('info')} Deleted {deleted_count} of {len(existing_snapshots)} snapshots.")
+            with get_query_cache(config_obj) as cache:
+                cache.clear()
+            click.echo(f"\n{_ICON_INFO} Deleted {deleted_count} of {len(existing_snapshots)} snapshots.")
             return
         
         # Delete specific snapshots
         existing_snapshots = vm_manager.list_snapshots(vm_name, platform)
-        existing_names = [s['name'] for s in existing_snapshots]
+        by_name = {s['name']: s for s in existing_snapshots}
         
         snapshots_to_delete = []
         for snapshot_name in snapshot_names:
-            if snapshot_name in existing_names:
+            if snapshot_name in by_name:
                 snapshots_to_delete.append(snapshot_name)
             else:
-                click.echo(f"{format_status_icon('warning')} Snapshot not found: {snapshot_name}")
+                click.echo(f"{_ICON_WARNING} Snapshot not found: {snapshot_name}")
         
         if not snapshots_to_delete:
             click.echo("No valid snapshots to delete.")
             return
         
         # Show what will be deleted
-        click.echo(f"\n{format_status_icon('delete')} Snapshots to delete from VM '{vm_name}':")
+        output = [f"\n{_ICON_DELETE} Snapshots to delete from VM '{vm_name}':"]
         for snapshot_name in snapshots_to_delete:
-            snapshot_info = next(s for s in existing_snapshots if s['name'] == snapshot_name)
+            snapshot_info = by_name[snapshot_name]
             created = extract_clean_timestamp(snapshot_info.get('created_at', 'unknown'))
-            click.echo(f"  - {snapshot_name} (created: {created})")
+            output.append(f"  - {snapshot_name} (created: {created})")
+        click.echo("\n".join(output))
         
         # Confirm deletion
         if not confirm:
@@ -595,17 +832,19 @@ def vm_delete_snapshot(ctx, vm_name: str, snapshot_names: tuple, platform: Optio
         
         # Delete snapshots
         deleted_count = 0
+        action = "Deleted" if no_purge else "Deleted and purged"
         for snapshot_name in snapshots_to_delete:
             success = vm_manager.delete_snapshot(vm_name, snapshot_name, platform, not no_purge)
             
             if success:
                 deleted_count += 1
-                action = "Deleted" if no_purge else "Deleted and purged"
-                click.echo(f"{format_status_icon('success')} {action}: {snapshot_name}")
+                click.echo(f"{_ICON_SUCCESS} {action}: {snapshot_name}")
             else:
-                click.echo(f"{format_status_icon('error')} Failed to delete: {snapshot_name}")
+                click.echo(f"{_ICON_ERROR} Failed to delete: {snapshot_name}")
         
-        click.echo(f"\n{format_status_icon('info')} Deleted {deleted_count} of {len(snapshots_to_delete)} snapshots.")
+        with get_query_cache(config_obj) as cache:
+            cache.clear()
+        click.echo(f"\n{_ICON_INFO} Deleted {deleted_count} of {len(snapshots_to_delete)} snapshots.")
         
     except Exception as e:
         notifier_obj.error(f"Snapshot deletion failed: {str(e)}")
@@ -621,13 +860,17 @@ def vm_cleanup(ctx, dry_run: bool):
     notifier_obj = ctx.obj['notifier']
     
     try:
+        from .vm_manager import VMManager
         vm_manager = VMManager(config_obj, notifier_obj)
         retention_count = config_obj.vm_snapshot_retention
         
         if dry_run:
-            click.echo(f"{format_status_icon('info')} Dry run - showing what snapshots would be deleted:")
-            click.echo(f"Retention policy: Keep last {retention_count} MinBackup snapshots per VM")
-            click.echo("-" * 70)
+            # Report lines are collected and written with a single echo
+            output = [
+                f"{_ICON_INFO} Dry run - showing what snapshots would be deleted:\n"
+                f"Retention policy: Keep last {retention_count} MinBackup snapshots per VM\n"
+                + "-" * 70
+            ]
             
             total_would_delete = 0
             
@@ -642,56 +885,67 @@ def vm_cleanup(ctx, dry_run: bool):
                     # Filter MinBackup snapshots
                     minbackup_snapshots = [
                         s for s in snapshots 
-                        if s["name"].startswith("minbackup") or s["name"].startswith("backup")
+                        if s["name"].startswith(MINBACKUP_SNAPSHOT_PREFIXES)
                     ]
                     
                     if len(minbackup_snapshots) > retention_count:
                         try:
                             minbackup_snapshots.sort(key=lambda x: x.get("timestamp") or datetime.min, reverse=True)
-                        except:
+                        except TypeError:
                             minbackup_snapshots.sort(key=lambda x: x.get("name", ""), reverse=True)
                         
                         old_snapshots = minbackup_snapshots[retention_count:]
                         
                         if old_snapshots:
-                            click.echo(f"\n  VM: {vm_name} ({platform_name})")
-                            click.echo(f"    Total MinBackup snapshots: {len(minbackup_snapshots)}")
-                            click.echo(f"    Would keep: {retention_count}")
-                            click.echo(f"    Would delete: {len(old_snapshots)}")
+                            output.append(
+                                f"\n  VM: {vm_name} ({platform_name})\n"
+                                f"    Total MinBackup snapshots: {len(minbackup_snapshots)}\n"
+                                f"    Would keep: {retention_count}\n"
+                                f"    Would delete: {len(old_snapshots)}"
+                            )
                             
                             for snapshot in old_snapshots:
                                 created = extract_clean_timestamp(snapshot.get('created_at', 'unknown'))
-                                click.echo(f"      📦 {snapshot['name']} (created: {created})")
+                                output.append(f"      📦 {snapshot['name']} (created: {created})")
                             
                             platform_deletions += len(old_snapshots)
                 
                 if platform_deletions > 0:
-                    click.echo(f"\n  {platform_name.upper()}: {platform_deletions} snapshots would be deleted")
+                    output.append(f"\n  {platform_name.upper()}: {platform_deletions} snapshots would be deleted")
                     total_would_delete += platform_deletions
             
-            click.echo(f"\n{format_status_icon('info')} Total snapshots that would be deleted: {total_would_delete}")
+            output.append(f"\n{_ICON_INFO} Total snapshots that would be deleted: {total_would_delete}")
             
             if total_would_delete == 0:
-                click.echo("No old MinBackup snapshots found that exceed retention policy.")
+                output.append("No old MinBackup snapshots found that exceed retention policy.")
+            
+            click.echo("\n".join(output))
         else:
-            click.echo(f"{format_status_icon('cleanup')} Starting VM snapshot cleanup...")
-            click.echo(f"Retention policy: Keep last {retention_count} MinBackup snapshots per VM")
+            click.echo(
+                f"{_ICON_CLEANUP} Starting VM snapshot cleanup...\n"
+                f"Retention policy: Keep last {retention_count} MinBackup snapshots per VM"
+            )
             
             cleanup_summary = vm_manager.cleanup_old_snapshots()
+            with get_query_cache(config_obj) as cache:
+                cache.clear()
             
-            click.echo(f"\n{format_status_icon('cleanup')} Cleanup Summary:")
-            click.echo(f"VMs processed: {cleanup_summary['vms_processed']}")
-            click.echo(f"Snapshots deleted: {cleanup_summary['total_deleted']}")
+            click.echo(
+                f"\n{_ICON_CLEANUP} Cleanup Summary:\n"
+                f"VMs processed: {cleanup_summary['vms_processed']}\n"
+                f"Snapshots deleted: {cleanup_summary['total_deleted']}"
+            )
             
             if cleanup_summary['errors']:
-                click.echo(f"Errors: {len(cleanup_summary['errors'])}")
-                for error in cleanup_summary['errors']:
-                    click.echo(f"  - {error}")
+                click.echo("\n".join(
+                    [f"Errors: {len(cleanup_summary['errors'])}"]
+                    + [f"  - {error}" for error in cleanup_summary['errors']]
+                ))
             
             if cleanup_summary['total_deleted'] == 0:
-                click.echo(f"{format_status_icon('success')} No cleanup needed - all snapshots within retention limits.")
+                click.echo(f"{_ICON_SUCCESS} No cleanup needed - all snapshots within retention limits.")
             else:
-                click.echo(f"{format_status_icon('success')} VM snapshot cleanup completed successfully.")
+                click.echo(f"{_ICON_SUCCESS} VM snapshot cleanup completed successfully.")
         
     except Exception as e:
         notifier_obj.error(f"VM cleanup failed: {str(e)}")
@@ -700,13 +954,26 @@ def vm_cleanup(ctx, dry_run: bool):
 
 @cli.command()
 @click.option('--json', 'output_json', is_flag=True, help='Output in JSON format')
+@click.option('--with-scheduler', is_flag=True,
+              help='Include automatic snapshot status from the same VM scan')
 @click.pass_context
-def status(ctx, output_json: bool):
+def status(ctx, output_json: bool, with_scheduler: bool):
     """Show VM snapshot status and statistics."""
     config_obj = ctx.obj['config']
     notifier_obj = ctx.obj['notifier']
     
+    # Report lines are collected and written with a single echo
+    output = []
+    
     try:
+        from .vm_manager import VMManager
+        
+        # Nothing to scan: skip building the report (JSON callers still get the full shape),
+        # checking PATH before paying for a full VMManager
+        if not output_json and not with_scheduler and not VMManager.detect_platforms(config_obj):
+            click.echo(f"{_ICON_INFO} No VM platforms detected.")
+            return
+        
         vm_manager = VMManager(config_obj, notifier_obj)
         
         # Get VM status with snapshot info
@@ -718,27 +985,35 @@ def status(ctx, output_json: bool):
             "vm_details": []
         }
         
+        # Platform and snapshot listings are subprocess calls: fan them out,
+        # keyed by VM so the report keeps the platform and VM order
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=STATUS_QUERY_WORKERS) as executor:
+            vm_futures = {
+                platform_name: executor.submit(vm_manager.list_vms, platform_name)
+                for platform_name in vm_manager.available_platforms
+            }
+            platform_vms = {platform_name: future.result() for platform_name, future in vm_futures.items()}
+            snapshot_futures = {
+                (platform_name, vm["name"]): executor.submit(vm_manager.list_snapshots, vm["name"], platform_name)
+                for platform_name, vms in platform_vms.items()
+                for vm in vms
+            }
+        
         # Collect detailed VM and snapshot information
-        for platform_name, platform in vm_manager.available_platforms.items():
-            vms = platform.list_vms()
+        for platform_name, vms in platform_vms.items():
             vm_status["total_vms"] += len(vms)
             
             for vm in vms:
-                snapshots = platform.list_snapshots(vm["name"])
+                snapshots = snapshot_futures[(platform_name, vm["name"])].result()
                 vm_status["total_snapshots"] += len(snapshots)
                 
-                minbackup_count = len([s for s in snapshots if s["name"].startswith("minbackup") or s["name"].startswith("backup")])
+                minbackup_count = sum(1 for s in snapshots if s["name"].startswith(MINBACKUP_SNAPSHOT_PREFIXES))
                 vm_status["minbackup_snapshots"] += minbackup_count
                 
-                vm_detail = {
-                    "name": vm["name"],
-                    "platform": platform_name,
-                    "state": vm.get("state", "unknown"),
-                    "snapshot_count": len(snapshots),
-                    "minbackup_snapshots": minbackup_count
-                }
-                
-                vm_status["vm_details"].append(vm_detail)
+                vm_status["vm_details"].append(VMDetail(
+                    vm["name"], platform_name, vm.get("state", "unknown"), len(snapshots), minbackup_count
+                ))
         
         # Combined status
         status_info = {
@@ -748,33 +1023,108 @@ def status(ctx, output_json: bool):
             }
         }
         
+        # Reuse this scan's totals instead of letting the scheduler list everything again
+        scheduler_status = None
+        if with_scheduler:
+            scheduler_status = get_scheduler(ctx).get_status(
+                vm_counts=(vm_status["total_vms"], vm_status["total_snapshots"])
+            )
+            status_info["scheduler"] = scheduler_status_json(dict(scheduler_status))
+        
         if output_json:
-            click.echo(json.dumps(status_info, indent=2))
+            json_dump(status_info, sys.stdout)
         else:
-            click.echo(f"\n{format_status_icon('vm')} MinBackup VM Status")
-            click.echo("=" * 50)
+            output.append(f"\n{_ICON_VM} MinBackup VM Status")
+            output.append("=" * 50)
             
             # VM info
-            click.echo(f"\n{format_status_icon('snapshot')} Virtual Machines:")
-            click.echo(f"  Available Platforms: {', '.join(vm_status['available_platforms']) or 'None'}")
-            click.echo(f"  Total VMs: {vm_status['total_vms']}")
-            click.echo(f"  Total Snapshots: {vm_status['total_snapshots']}")
-            click.echo(f"  MinBackup Snapshots: {vm_status['minbackup_snapshots']}")
-            click.echo(f"  Snapshot Retention: Keep last {config_obj.vm_snapshot_retention}")
+            output.append(f"\n{_ICON_SNAPSHOT} Virtual Machines:")
+            output.append(f"  Available Platforms: {', '.join(vm_status['available_platforms']) or 'None'}")
+            output.append(f"  Total VMs: {vm_status['total_vms']}")
+            output.append(f"  Total Snapshots: {vm_status['total_snapshots']}")
+            output.append(f"  MinBackup Snapshots: {vm_status['minbackup_snapshots']}")
+            output.append(f"  Snapshot Retention: Keep last {config_obj.vm_snapshot_retention}")
             
             if vm_status['vm_details']:
-                click.echo(f"\n{format_status_icon('info')} VM Details:")
+                output.append(f"\n{_ICON_INFO} VM Details:")
                 for vm_detail in vm_status['vm_details']:
-                    click.echo(f"    📱 {vm_detail['name']} ({vm_detail['platform']}):")
-                    click.echo(f"      State: {vm_detail['state']}")
-                    click.echo(f"      Snapshots: {vm_detail['snapshot_count']} total, {vm_detail['minbackup_snapshots']} MinBackup")
+                    output.append(f"    📱 {vm_detail.name} ({vm_detail.platform}):")
+                    output.append(f"      State: {vm_detail.state}")
+                    output.append(f"      Snapshots: {vm_detail.snapshot_count} total, {vm_detail.minbackup_snapshots} MinBackup")
+            
+            output.append(f"\n{_ICON_SUCCESS} System ready for VM snapshot management")
             
-            click.echo(f"\n{format_status_icon('success')} System ready for VM snapshot management")
+            if scheduler_status is not None:
+                output.extend(scheduler_report_lines(scheduler_status))
+            
+            click.echo("\n".join(output))
         
     except Exception as e:
+        if output:
+            click.echo("\n".join(output))
         notifier_obj.error(f"Status check failed: {str(e)}")
         sys.exit(1)
 
+def get_scheduler(ctx) -> "SnapshotScheduler":
+    """Get this invocation's scheduler, creating it on first use."""
+    if 'scheduler' not in ctx.obj:
+        from .scheduler import SnapshotScheduler
+        ctx.obj['scheduler'] = SnapshotScheduler(ctx.obj['config'], ctx.obj['notifier'])
+    return ctx.obj['scheduler']
+
+
+def scheduler_status_json(status: dict) -> dict:
+    """Make scheduler status JSON-friendly, with run times as ISO strings."""
+    for key in ("last_run", "next_run"):
+        if status[key]:
+            status[key] = status[key].isoformat()
+    return status
+
+
+def scheduler_report_lines(status: dict) -> list:
+    """Render scheduler status as report lines."""
+    lines = []
+    
+    lines.append(f"\n{_ICON_INFO} Automatic Snapshot Status")
+    lines.append("=" * 50)
+    
+    # Status
+    enabled_icon = "✅" if status["enabled"] else "❌"
+    running_icon = "🟢" if status["running"] else "🔴"
+    
+    lines.append(f"\nEnabled: {enabled_icon} {status['enabled']}")
+    lines.append(f"Daemon Running: {running_icon} {status['running']}")
+    lines.append(f"Interval: {status['interval']}")
+    
+    # Timing
+    if status["last_run"]:
+        lines.append(f"Last Run: {status['last_run']:%Y-%m-%d %H:%M:%S}")
+    else:
+        lines.append("Last Run: Never")
+    
+    if status["next_run"]:
+        lines.append(f"Next Run: {status['next_run']:%Y-%m-%d %H:%M:%S}")
+    else:
+        lines.append("Next Run: Not scheduled")
+    
+    # System info
+    lines.append(f"\nVMs Monitored: {status['vm_count']}")
+    lines.append(f"Total Snapshots: {status['total_snapshots']}")
+    
+    # Instructions
+    if not status["enabled"]:
+        lines.append(f"\n{_ICON_INFO} To enable automatic snapshots:")
+        lines.append("  minbackup auto enable <interval>")
+        lines.append("  Example: minbackup auto enable 4h")
+    elif not status["running"]:
+        lines.append(f"\n{_ICON_INFO} To start the scheduler:")
+        lines.append("  minbackup auto start")
+    else:
+        lines.append(f"\n{_ICON_SUCCESS} Scheduler is running!")
+    
+    return lines
+
+
 @cli.group('auto')
 @click.pass_context
 def auto(ctx):
@@ -798,12 +1148,14 @@ def auto_enable(ctx, interval: str):
     notifier_obj = ctx.obj['notifier']
     
     try:
-        scheduler = SnapshotScheduler(config_obj, notifier_obj)
+        scheduler = get_scheduler(ctx)
         scheduler.enable(interval)
         
-        click.echo(f"{format_status_icon('success')} Automatic snapshots enabled!")
-        click.echo(f"Interval: {interval}")
-        click.echo(f"Use 'minbackup auto start' to start the scheduler daemon.")
+        click.echo(
+            f"{_ICON_SUCCESS} Automatic snapshots enabled!\n"
+            f"Interval: {interval}\n"
+            "Use 'minbackup auto start' to start the scheduler daemon."
+        )
         
     except Exception as e:
         notifier_obj.error(f"Failed to enable automatic snapshots: {str(e)}")
@@ -817,10 +1169,10 @@ def auto_disable(ctx):
     notifier_obj = ctx.obj['notifier']
     
     try:
-        scheduler = SnapshotScheduler(config_obj, notifier_obj)
+        scheduler = get_scheduler(ctx)
         scheduler.disable()
         
-        click.echo(f"{format_status_icon('success')} Automatic snapshots disabled!")
+        click.echo(f"{_ICON_SUCCESS} Automatic snapshots disabled!")
         
     except Exception as e:
         notifier_obj.error(f"Failed to disable automatic snapshots: {str(e)}")
@@ -834,27 +1186,22 @@ def auto_start(ctx):
     notifier_obj = ctx.obj['notifier']
     
     try:
-        scheduler = SnapshotScheduler(config_obj, notifier_obj)
+        scheduler = get_scheduler(ctx)
         
         if not scheduler.is_enabled():
-            click.echo(f"{format_status_icon('error')} Automatic snapshots are not enabled.")
-            click.echo("Use 'minbackup auto enable <interval>' first.")
+            click.echo(f"{_ICON_ERROR} Automatic snapshots are not enabled.\nUse 'minbackup auto enable <interval>' first.")
             sys.exit(1)
         
-        click.echo(f"{format_status_icon('info')} Starting scheduler daemon...")
-        click.echo("Press Ctrl+C to stop the daemon.")
+        running_pid = scheduler.daemon_pid()
+        if running_pid is not None:
+            click.echo(f"{_ICON_ERROR} Scheduler daemon is already running (PID {running_pid}).")
+            sys.exit(1)
         
-        try:
-            scheduler.start_daemon()
-            
-            # Keep the main thread alive while daemon runs
-            while scheduler.running:
-                time.sleep(1)
-                
-        except KeyboardInterrupt:
-            click.echo(f"\n{format_status_icon('info')} Stopping scheduler...")
-            scheduler.stop_daemon()
-            click.echo(f"{format_status_icon('success')} Scheduler stopped.")
+        click.echo(f"{_ICON_INFO} Starting scheduler daemon...\nPress Ctrl+C to stop the daemon.")
+        
+        # Runs in the foreground; its SIGINT/SIGTERM handlers stop it cleanly
+        scheduler.start_daemon()
+        click.echo(f"{_ICON_SUCCESS} Scheduler stopped.")
         
     except Exception as e:
         notifier_obj.error(f"Failed to start scheduler: {str(e)}")
@@ -868,8 +1215,19 @@ def auto_stop(ctx):
     notifier_obj = ctx.obj['notifier']
     
     try:
-        # For now, this is mainly for status - the daemon stops when you Ctrl+C
-        click.echo(f"{format_status_icon('info')} To stop the daemon, use Ctrl+C in the terminal where it's running.")
+        scheduler = get_scheduler(ctx)
+        pid = scheduler.daemon_pid()
+        
+        if pid is None:
+            click.echo(f"{_ICON_INFO} Scheduler daemon is not running.")
+            return
+        
+        click.echo(f"{_ICON_INFO} Stopping scheduler daemon (PID {pid})...")
+        if scheduler.stop_running_daemon():
+            click.echo(f"{_ICON_SUCCESS} Scheduler stopped.")
+        else:
+            click.echo(f"{_ICON_ERROR} Scheduler daemon did not exit in time.")
+            sys.exit(1)
         
     except Exception as e:
         notifier_obj.error(f"Failed to stop scheduler: {str(e)}")
@@ -883,54 +1241,23 @@ def auto_status(ctx, output_json: bool):
     config_obj = ctx.obj['config']
     notifier_obj = ctx.obj['notifier']
     
+    # Report lines are collected and written with a single echo
+    output = []
+    
     try:
-        scheduler = SnapshotScheduler(config_obj, notifier_obj)
+        scheduler = get_scheduler(ctx)
         status = scheduler.get_status()
         
         if output_json:
-            click.echo(json.dumps(status, indent=2))
+            json_dump(scheduler_status_json(status), sys.stdout)
             return
         
-        click.echo(f"\n{format_status_icon('info')} Automatic Snapshot Status")
-        click.echo("=" * 50)
-        
-        # Status
-        enabled_icon = "✅" if status["enabled"] else "❌"
-        running_icon = "🟢" if status["running"] else "🔴"
-        
-        click.echo(f"\nEnabled: {enabled_icon} {status['enabled']}")
-        click.echo(f"Daemon Running: {running_icon} {status['running']}")
-        click.echo(f"Interval: {status['interval']}")
-        
-        # Timing
-        if status["last_run"]:
-            last_run = status["last_run"][:19].replace('T', ' ')
-            click.echo(f"Last Run: {last_run}")
-        else:
-            click.echo("Last Run: Never")
-        
-        if status["next_run"]:
-            next_run = status["next_run"][:19].replace('T', ' ')
-            click.echo(f"Next Run: {next_run}")
-        else:
-            click.echo("Next Run: Not scheduled")
-        
-        # System info
-        click.echo(f"\nVMs Monitored: {status['vm_count']}")
-        click.echo(f"Total Snapshots: {status['total_snapshots']}")
-        
-        # Instructions
-        if not status["enabled"]:
-            click.echo(f"\n{format_status_icon('info')} To enable automatic snapshots:")
-            click.echo("  minbackup auto enable <interval>")
-            click.echo("  Example: minbackup auto enable 4h")
-        elif not status["running"]:
-            click.echo(f"\n{format_status_icon('info')} To start the scheduler:")
-            click.echo("  minbackup auto start")
-        else:
-            click.echo(f"\n{format_status_icon('success')} Scheduler is running!")
+        output.extend(scheduler_report_lines(status))
+        click.echo("\n".join(output))
         
     except Exception as e:
+        if output:
+            click.echo("\n".join(output))
         notifier_obj.error(f"Failed to get scheduler status: {str(e)}")
         sys.exit(1)
 
@@ -942,16 +1269,15 @@ def auto_run_now(ctx):
     notifier_obj = ctx.obj['notifier']
     
     try:
-        scheduler = SnapshotScheduler(config_obj, notifier_obj)
+        scheduler = get_scheduler(ctx)
         
         if not scheduler.is_enabled():
-            click.echo(f"{format_status_icon('error')} Automatic snapshots are not enabled.")
-            click.echo("Use 'minbackup auto enable <interval>' first.")
+            click.echo(f"{_ICON_ERROR} Automatic snapshots are not enabled.\nUse 'minbackup auto enable <interval>' first.")
             sys.exit(1)
         
-        click.echo(f"{format_status_icon('info')} Running automatic snapshots now...")
+        click.echo(f"{_ICON_INFO} Running automatic snapshots now...")
         scheduler.run_now()
-        click.echo(f"{format_status_icon('success')} Automatic snapshot run completed!")
+        click.echo(f"{_ICON_SUCCESS} Automatic snapshot run completed!")
         
     except Exception as e:
         notifier_obj.error(f"Failed to run automatic snapshots: {str(e)}")
@@ -959,21 +1285,18 @@ def auto_run_now(ctx):
         
 def get_snapshot_type(snapshot_name: str) -> str:
     """Get snapshot type indicator."""
-    if snapshot_name.startswith("auto"):
+    if snapshot_name.startswith(AUTO_SNAPSHOT_PREFIXES):
         return "AUTO"
-    elif snapshot_name.startswith(("minbackup", "backup")):
+    elif snapshot_name.startswith(MINBACKUP_SNAPSHOT_PREFIXES):
         return "MB"
     else:
         return "MAN"
 
+SNAPSHOT_TYPE_NAMES = {"AUTO": "Automatic", "MB": "MinBackup", "MAN": "Manual"}
+
 def get_snapshot_type_full(snapshot_name: str) -> str:
     """Get full snapshot type name."""
-    if snapshot_name.startswith("auto"):
-        return "Automatic"
-    elif snapshot_name.startswith(("minbackup", "backup")):
-        return "MinBackup"
-    else:
-        return "Manual"
+    return SNAPSHOT_TYPE_NAMES[get_snapshot_type(snapshot_name)]
 
 def main():
     """Main entry point for CLI."""
@@ -1,9 +1,55 @@
 """Simplified configuration management for VM snapshots only."""
 
 import os
-import yaml
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class VMSettings:
+    """Typed, read-only view of the `vm` configuration section."""
+    __slots__ = ("platforms", "snapshot_retention", "timeout")
+    
+    platforms: Tuple[str, ...]
+    snapshot_retention: int
+    timeout: int
+
+
+# Parsed config files by path, with the mtime they were read at
+_YAML_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def _load_yaml(config_file: str) -> Any:
+    """Parse a YAML file, reusing the last parse while its mtime is unchanged.
+    
+    Args:
+        config_file: Path to the YAML file
+        
+    Returns:
+        Parsed document (a private copy the caller may modify)
+    """
+    mtime = os.stat(config_file).st_mtime_ns
+    cached = _YAML_CACHE.get(config_file)
+    if cached is None or cached[0] != mtime:
+        # yaml is imported here so commands that never read a config file skip it
+        import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader
+        
+        with open(config_file, 'r') as f:
+            cached = (mtime, yaml.load(f, Loader=SafeLoader))
+        _YAML_CACHE[config_file] = cached
+    return copy.deepcopy(cached[1])
+
+
+@lru_cache(maxsize=128)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key, memoized since the same keys are read repeatedly."""
+    return tuple(key.split('.'))
 
 
 class Config:
@@ -16,12 +62,18 @@ class Config:
             config_file: Path to configuration file
         """
         self._config = self._get_default_config()
+        # Built on first access to .vm and dropped whenever the config changes
+        self._vm_settings = None
         
-        # Load configuration file if provided
-        if config_file and Path(config_file).exists():
-            self.load(config_file)
-        elif Path("minbackup.yaml").exists():
-            self.load("minbackup.yaml")
+        # Load the given file, else ./minbackup.yaml; missing files are skipped
+        for candidate in (config_file, "minbackup.yaml"):
+            if not candidate:
+                continue
+            try:
+                self.load(candidate)
+                break
+            except FileNotFoundError:
+                continue
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
@@ -42,15 +94,17 @@ class Config:
         """Load configuration from file.
         
         Args:
-            config_file: Path to configuration file
+            config_file: Path to configuration file (FileNotFoundError if missing)
         """
         try:
-            with open(config_file, 'r') as f:
-                file_config = yaml.safe_load(f)
+            file_config = _load_yaml(config_file)
             
             if file_config:
                 self._merge_config(self._config, file_config)
+                self._vm_settings = None
                 
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to load configuration from {config_file}: {str(e)}")
     
@@ -60,12 +114,29 @@ class Config:
         Args:
             config_file: Path to save configuration
         """
+        import yaml
         try:
+            from yaml import CSafeDumper as SafeDumper
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeDumper
+        
+        try:
+            # Serialize to a string first so the file gets a single write
+            document = yaml.dump(self._config, Dumper=SafeDumper, default_flow_style=False, indent=2)
             with open(config_file, 'w') as f:
-                yaml.dump(self._config, f, default_flow_style=False, indent=2)
+                f.write(document)
         except Exception as e:
             raise ValueError(f"Failed to save configuration to {config_file}: {str(e)}")
     
+    def merge(self, overrides: Dict[str, Any]) -> None:
+        """Merge configuration values, keeping keys the overrides don't set.
+        
+        Args:
+            overrides: Nested configuration dictionary to merge in
+        """
+        self._merge_config(self._config, overrides)
+        self._vm_settings = None
+    
     def _merge_config(self, base: Dict[str, Any], override: Dict[str, Any]) -> None:
         """Recursively merge configuration dictionaries."""
         for key, value in override.items():
@@ -84,7 +155,7 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         value = self._config
         
         try:
@@ -101,7 +172,7 @@ class Config:
             key: Configuration key (e.g., 'vm.snapshot_retention')
             value: Value to set
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self._config
         
         # Navigate to parent
@@ -112,13 +183,25 @@ class Config:
         
         # Set value
         config[keys[-1]] = value
+        self._vm_settings = None
+    
+    @property
+    def vm(self) -> VMSettings:
+        """Get the VM settings, parsed once until the configuration changes."""
+        if self._vm_settings is None:
+            self._vm_settings = VMSettings(
+                platforms=tuple(self.get('vm.platforms', ['multipass', 'virtualbox', 'vmware'])),
+                snapshot_retention=self.get('vm.snapshot_retention', 7),
+                timeout=self.get('vm.timeout', 300)
+            )
+        return self._vm_settings
     
     @property
-    def supported_vm_platforms(self) -> List[str]:
-        """Get list of supported VM platforms."""
-        return self.get('vm.platforms', ['multipass', 'virtualbox', 'vmware'])
+    def supported_vm_platforms(self) -> Tuple[str, ...]:
+        """Get supported VM platforms."""
+        return self.vm.platforms
     
     @property
     def vm_snapshot_retention(self) -> int:
         """Get VM snapshot retention count."""
-        return self.get('vm.snapshot_retention', 7)
\ No newline at end of file
+        return self.vm.snapshot_retention
\ No newline at end of file
@@ -1,15 +1,79 @@
 """Automatic VM snapshot scheduler - Windows-friendly version."""
 
+import os
+import re
+import csv
 import time
 import signal
 import sys
-import json
-from datetime import datetime, timedelta
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
+from .cache import QueryCache, DEFAULT_CACHE_TTL
 from .vm_manager import VMManager
-from .utils import NotificationManager
+from .utils import NotificationManager, json_loads, json_dumps
+
+
+# Intervals like "30m", "2h", "1d"; a bare number means minutes
+INTERVAL_RE = re.compile(r'^(\d+)([mhd]?)$')
+INTERVAL_UNIT_MINUTES = {'m': 1, 'h': 60, 'd': 1440}
+
+# Longest single daemon sleep, so wall-clock jumps are noticed within a minute
+DAEMON_MAX_WAIT = 60.0
+
+# Longest slice of a daemon sleep, bounding how long a shutdown signal goes unnoticed
+DAEMON_STOP_POLL = 1.0
+
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process exists."""
+    if os.name == "nt":
+        # Signal 0 would terminate the process on Windows; ask tasklist instead
+        result = subprocess.run(
+            ["tasklist", "/FI", f"PID eq {pid}", "/FO", "CSV", "/NH"],
+            capture_output=True, text=True
+        )
+        # Rows are "Image Name","PID",...; a miss prints an INFO line instead
+        return any(
+            len(row) > 1 and row[1] == str(pid)
+            for row in csv.reader(result.stdout.splitlines())
+        )
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _process_start_time(pid: int) -> Optional[str]:
+    """Get an opaque token for when a process started.
+    
+    Together with the PID this identifies one process, so a PID reused by
+    an unrelated process after the daemon died is not mistaken for it.
+    
+    Returns:
+        Start time token, or None if it cannot be determined here
+    """
+    try:
+        # Field 22 of /proc/<pid>/stat, counted after the parenthesized name
+        stat = Path(f"/proc/{pid}/stat").read_text()
+        return stat.rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        pass
+    
+    if os.name == "nt":
+        return None
+    try:
+        result = subprocess.run(["ps", "-o", "lstart=", "-p", str(pid)], capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
 
 
 class SnapshotScheduler:
@@ -24,9 +88,15 @@ class SnapshotScheduler:
         # State file for persistence
         self.state_file = Path("minbackup_scheduler.json")
         
+        # Holds the PID of a running daemon so other invocations can stop it
+        self.pid_file = self.state_file.with_suffix(".pid")
+        
         # Load state
         self.state = self._load_state()
         self.running = False
+        
+        # Set on shutdown; the daemon blocks on it between checks
+        self._stopped = threading.Event()
     
     def _load_state(self) -> Dict[str, Any]:
         """Load scheduler state from file."""
@@ -40,8 +110,8 @@ class SnapshotScheduler:
         
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    saved_state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    saved_state = json_loads(f.read())
                     default_state.update(saved_state)
             except Exception as e:
                 self.notifier.warning(f"Failed to load scheduler state: {e}")
@@ -52,7 +122,7 @@ class SnapshotScheduler:
         """Save scheduler state to file."""
         try:
             with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+                f.write(json_dumps(self.state))
         except Exception as e:
             self.notifier.error(f"Failed to save scheduler state: {e}")
     
@@ -60,16 +130,14 @@ class SnapshotScheduler:
         """Parse interval string to minutes."""
         interval_str = interval_str.lower().strip()
         
-        import re
-        match = re.match(r'^(\d+)([mhd]?)$', interval_str)
+        match = INTERVAL_RE.match(interval_str)
         if not match:
             raise ValueError(f"Invalid interval format: {interval_str}. Use format like '10m', '2h', '1d'")
         
         number = int(match.group(1))
         unit = match.group(2) or 'm'
         
-        multipliers = {'m': 1, 'h': 60, 'd': 1440}
-        return number * multipliers[unit]
+        return number * INTERVAL_UNIT_MINUTES[unit]
     
     def _format_interval(self, minutes: int) -> str:
         """Format minutes to human readable string."""
@@ -97,13 +165,13 @@ class SnapshotScheduler:
             
             self.state["enabled"] = True
             self.state["interval_minutes"] = interval_minutes
-            self.state["next_run"] = (datetime.now() + timedelta(minutes=interval_minutes)).isoformat()
+            self.state["next_run"] = time.time() + interval_minutes * 60
             
             self._save_state()
             
             interval_formatted = self._format_interval(interval_minutes)
             self.notifier.success(f"Automatic snapshots enabled with interval: {interval_formatted}")
-            self.notifier.info(f"Next snapshot scheduled for: {self.state['next_run'][:19].replace('T', ' ')}")
+            self.notifier.info(f"Next snapshot scheduled for: {self._state_time('next_run'):%Y-%m-%d %H:%M:%S}")
             
         except ValueError as e:
             self.notifier.error(str(e))
@@ -121,19 +189,99 @@ class SnapshotScheduler:
         """Check if automatic snapshots are enabled."""
         return self.state.get("enabled", False)
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get scheduler status information."""
+    def daemon_pid(self) -> Optional[int]:
+        """Get the PID of a daemon running in another process.
+        
+        Returns:
+            PID from the PID file if that process is still the daemon that
+            wrote it, otherwise None
+        """
+        try:
+            pid_text, _, start_time = self.pid_file.read_text().strip().partition(" ")
+            pid = int(pid_text)
+        except (OSError, ValueError):
+            return None
+        
+        if not _process_alive(pid):
+            return None
+        
+        # The recorded start time guards against PID reuse; files without one
+        # (older versions) and platforms that can't report it rely on liveness
+        if start_time and _process_start_time(pid) not in (None, start_time):
+            return None
+        
+        return pid
+    
+    def stop_running_daemon(self, timeout: float = 10) -> bool:
+        """Stop a daemon started by another process.
+        
+        Args:
+            timeout: Seconds to wait for the daemon to exit
+            
+        Returns:
+            True if a daemon was running and has exited
+        """
+        pid = self.daemon_pid()
+        if pid is None:
+            return False
+        
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/PID", str(pid)], capture_output=True)
+        else:
+            # Handled like Ctrl+C: the daemon finishes its current step and exits
+            os.kill(pid, signal.SIGTERM)
+        
+        deadline = time.monotonic() + timeout
+        while _process_alive(pid):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+    
+    def _state_timestamp(self, key: str) -> Optional[float]:
+        """Get a POSIX timestamp stored in the state file.
+        
+        Times are stored as numbers; ISO strings written by older versions
+        are parsed once and replaced in memory.
+        """
+        value = self.state.get(key)
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value).timestamp()
+            except ValueError:
+                value = None
+            self.state[key] = value
+        return value if isinstance(value, (int, float)) else None
+    
+    def _state_time(self, key: str) -> Optional[datetime]:
+        """Get a time stored in the state file as a local datetime."""
+        timestamp = self._state_timestamp(key)
+        return datetime.fromtimestamp(timestamp) if timestamp is not None else None
+    
+    def get_status(self, vm_counts: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """Get scheduler status information.
+        
+        last_run and next_run are datetimes, or None when unset.
+        
+        Args:
+            vm_counts: (vm_count, total_snapshots) already gathered by the
+                caller, which skips enumerating VMs and snapshots again
+        """
         status = {
             "enabled": self.state.get("enabled", False),
-            "running": self.running,
+            "running": self.running or self.daemon_pid() is not None,
             "interval": self._format_interval(self.state.get("interval_minutes", 360)),
             "interval_minutes": self.state.get("interval_minutes", 360),
-            "last_run": self.state.get("last_run"),
-            "next_run": self.state.get("next_run"),
+            "last_run": self._state_time("last_run"),
+            "next_run": self._state_time("next_run"),
             "vm_count": 0,
             "total_snapshots": 0
         }
         
+        if vm_counts is not None:
+            status["vm_count"], status["total_snapshots"] = vm_counts
+            return status
+        
         # Get VM counts
         try:
             all_vms = self.vm_manager.list_all_vms()
@@ -144,9 +292,9 @@ class SnapshotScheduler:
                     try:
                         snapshots = self.vm_manager.list_snapshots(vm['name'], platform_name)
                         status["total_snapshots"] += len(snapshots)
-                    except:
+                    except Exception:
                         pass
-        except:
+        except Exception:
             pass
         
         return status
@@ -156,15 +304,18 @@ class SnapshotScheduler:
         if not self.state.get("enabled", False):
             return False
         
-        next_run_str = self.state.get("next_run")
-        if not next_run_str:
+        next_run = self._state_timestamp("next_run")
+        if next_run is None:
             return True
         
-        try:
-            next_run = datetime.fromisoformat(next_run_str)
-            return datetime.now() >= next_run
-        except:
-            return True
+        return time.time() >= next_run
+    
+    def _seconds_until_next_run(self) -> float:
+        """Get how long the daemon can sleep before its next check."""
+        next_run = self._state_timestamp("next_run")
+        if next_run is None:
+            return DAEMON_MAX_WAIT
+        return max(0.0, min(DAEMON_MAX_WAIT, next_run - time.time()))
     
     def _create_auto_snapshots(self):
         """Create automatic snapshots for all VMs."""
@@ -176,35 +327,45 @@ class SnapshotScheduler:
             error_count = 0
             
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            snapshot_name = f"auto-{timestamp}"
             
-            for platform_name, vms in all_vms.items():
-                for vm in vms:
-                    vm_name = vm["name"]
+            jobs = [
+                (vm["name"], platform_name)
+                for platform_name, vms in all_vms.items()
+                for vm in vms
+            ]
+            
+            # Each snapshot is a separate subprocess call, so run them
+            # concurrently; results are handled here so state stays on this thread
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(16, len(jobs))) as executor:
+                    futures = {
+                        executor.submit(
+                            self.vm_manager.create_snapshot, vm_name, platform_name, snapshot_name
+                        ): vm_name
+                        for vm_name, platform_name in jobs
+                    }
                     
-                    try:
-                        snapshot_name = f"auto-{timestamp}"
+                    for future in as_completed(futures):
+                        vm_name = futures[future]
                         
-                        success = self.vm_manager.create_snapshot(
-                            vm_name, platform_name, snapshot_name
-                        )
-                        
-                        if success:
-                            snapshot_count += 1
-                            self.notifier.info(f"Auto snapshot created for {vm_name}: {snapshot_name}")
-                            self.state["vm_last_snapshot"][vm_name] = datetime.now().isoformat()
-                        else:
+                        try:
+                            if future.result():
+                                snapshot_count += 1
+                                self.notifier.info(f"Auto snapshot created for {vm_name}: {snapshot_name}")
+                                self.state["vm_last_snapshot"][vm_name] = time.time()
+                            else:
+                                error_count += 1
+                                self.notifier.warning(f"Failed to create auto snapshot for {vm_name}")
+                                
+                        except Exception as e:
                             error_count += 1
-                            self.notifier.warning(f"Failed to create auto snapshot for {vm_name}")
-                            
-                    except Exception as e:
-                        error_count += 1
-                        self.notifier.error(f"Error creating snapshot for {vm_name}: {str(e)}")
+                            self.notifier.error(f"Error creating snapshot for {vm_name}: {str(e)}")
             
             # Update state
-            self.state["last_run"] = datetime.now().isoformat()
-            self.state["next_run"] = (
-                datetime.now() + timedelta(minutes=self.state["interval_minutes"])
-            ).isoformat()
+            now = time.time()
+            self.state["last_run"] = now
+            self.state["next_run"] = now + self.state["interval_minutes"] * 60
             self._save_state()
             
             # Summary
@@ -223,6 +384,12 @@ class SnapshotScheduler:
                     self.notifier.info(f"Cleaned up {cleanup_summary['total_deleted']} old snapshots")
             except Exception as e:
                 self.notifier.warning(f"Cleanup failed: {str(e)}")
+            
+            # Snapshot listings cached by the CLI are stale after this round
+            with QueryCache(
+                self.config.get("cache.path"), ttl=self.config.get("cache.ttl", DEFAULT_CACHE_TTL)
+            ) as cache:
+                cache.clear()
                 
         except Exception as e:
             self.notifier.error(f"Auto snapshot creation failed: {str(e)}")
@@ -234,41 +401,81 @@ class SnapshotScheduler:
             return
         
         self.running = True
+        self._stopped.clear()
         
         # Setup signal handlers for graceful shutdown
+        # Only clears the flag: setting the Event takes its lock, which the
+        # interrupted main thread may be holding inside wait()
         def signal_handler(signum, frame):
             self.notifier.info("Received shutdown signal...")
             self.running = False
         
-        signal.signal(signal.SIGINT, signal_handler)
+        # SIGTERM lets service managers stop the daemon as cleanly as Ctrl+C
+        shutdown_signals = [signal.SIGINT]
         if hasattr(signal, 'SIGTERM'):
-            signal.signal(signal.SIGTERM, signal_handler)
+            shutdown_signals.append(signal.SIGTERM)
+        previous_handlers = {signum: signal.signal(signum, signal_handler) for signum in shutdown_signals}
+        
+        # PID plus start time, so other invocations can tell this process
+        # apart from an unrelated one that later reuses the PID
+        pid = os.getpid()
+        start_time = _process_start_time(pid)
+        pid_record = f"{pid} {start_time}" if start_time else str(pid)
+        self.pid_file.write_text(pid_record)
         
         interval_formatted = self._format_interval(self.state["interval_minutes"])
         self.notifier.success(f"Scheduler daemon started (interval: {interval_formatted})")
         
-        if self.state.get("next_run"):
-            next_run = self.state["next_run"][:19].replace('T', ' ')
-            self.notifier.info(f"Next snapshot scheduled for: {next_run}")
+        next_run = self._state_time("next_run")
+        if next_run:
+            self.notifier.info(f"Next snapshot scheduled for: {next_run:%Y-%m-%d %H:%M:%S}")
         
         # Main daemon loop
-        while self.running:
+        try:
+            while self.running:
+                try:
+                    wait = None
+                    if self._should_run_snapshot():
+                        self._create_auto_snapshots()
+                        # A failed round leaves next_run due; don't spin on it
+                        if self._should_run_snapshot():
+                            wait = DAEMON_MAX_WAIT
+                    
+                    # Sleep until the next run is due (at most a minute)
+                    self._sleep(wait if wait is not None else self._seconds_until_next_run())
+                            
+                except Exception as e:
+                    self.notifier.error(f"Scheduler daemon error: {str(e)}")
+                    self._sleep(60)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
             try:
-                if self._should_run_snapshot():
-                    self._create_auto_snapshots()
-                
-                # Sleep for 30 seconds, checking if we should stop
-                for _ in range(30):
-                    if not self.running:
-                        break
-                    time.sleep(1)
-                        
-            except Exception as e:
-                self.notifier.error(f"Scheduler daemon error: {str(e)}")
-                time.sleep(60)
+                if self.pid_file.read_text().strip() == pid_record:
+                    self.pid_file.unlink()
+            except OSError:
+                pass
         
         self.notifier.info("Snapshot scheduler daemon stopped")
     
+    def _sleep(self, seconds: float):
+        """Sleep for up to seconds, returning early once the daemon is stopped.
+        
+        Waits in short slices so a signal handler clearing self.running is
+        noticed promptly; stop_daemon() from another thread wakes it at once.
+        """
+        deadline = time.monotonic() + seconds
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._stopped.wait(min(remaining, DAEMON_STOP_POLL))
+    
+    def stop_daemon(self):
+        """Ask a running daemon loop to exit."""
+        self.running = False
+        self._stopped.set()
+    
     def run_now(self):
         """Run snapshot creation immediately (one-time)."""
         if not self.state.get("enabled", False):
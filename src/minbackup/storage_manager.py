@@ -1,21 +1,266 @@
 """Storage management for backup retention, cleanup, and recovery operations."""
 
 import os
+import gzip
 import json
 import tarfile
 import shutil
+import time
+import sqlite3
+import multiprocessing
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 
+from .backup_engine import CHUNK_EXTENSIONS, CHUNK_STORE_DIRNAME, INDEX_FILENAME, MANIFEST_EXTENSION
 from .utils import (
     NotificationManager,
     format_size,
     get_directory_size,
     calculate_checksum,
-    ensure_directory
+    new_hash,
+    ensure_directory,
+    json_loads
 )
 
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+# Archive names BackupEngine writes for full backups (gzip or zstd)
+ARCHIVE_SUFFIXES = (".tar.gz", ".tar.zst")
+
+# Every kind of backup: full archives and incremental manifests
+BACKUP_SUFFIXES = ARCHIVE_SUFFIXES + (MANIFEST_EXTENSION,)
+
+# Chunk garbage collection leaves recently written chunks alone, since a
+# running incremental backup has not written the manifest naming them yet
+CHUNK_GC_GRACE_SECONDS = 3600
+
+# Every zstd frame starts with this magic number
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Seconds a computed storage status is reused for repeated polls
+STATUS_CACHE_TTL = 5.0
+
+
+@contextmanager
+def _open_archive(path: Path, stream: bool = False):
+    """Open a backup archive for reading, gzip or zstd.
+    
+    The compression is sniffed from the magic bytes rather than the suffix.
+    zstd archives are read as a forward-only stream ('r|'), which suits the
+    sequential member walks done here. Without the zstandard package they
+    are decompressed by the zstd command instead.
+    
+    Args:
+        path: Archive path
+        stream: Open gzip archives as a forward-only stream too, for
+            callers that only iterate members once
+        
+    Yields:
+        Open TarFile
+    """
+    with open(path, 'rb') as raw:
+        magic = raw.read(len(ZSTD_MAGIC))
+        raw.seek(0)
+        
+        if magic == ZSTD_MAGIC:
+            if zstandard is not None:
+                # Parallel backups concatenate one zstd frame per part
+                reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+                with reader, tarfile.open(fileobj=reader, mode='r|') as tar:
+                    yield tar
+            elif shutil.which("zstd"):
+                with _zstd_command_reader(path) as reader, tarfile.open(fileobj=reader, mode='r|') as tar:
+                    yield tar
+            else:
+                raise ValueError("Reading zstd archives requires the 'zstandard' package or the zstd command")
+        else:
+            if stream:
+                # GzipFile rather than 'r|gz': parallel backups are several
+                # concatenated gzip members, and tarfile's own stream reader
+                # stops after the first
+                with gzip.GzipFile(fileobj=raw) as reader, tarfile.open(fileobj=reader, mode='r|') as tar:
+                    yield tar
+            else:
+                with tarfile.open(fileobj=raw, mode='r:gz') as tar:
+                    yield tar
+
+
+@contextmanager
+def _zstd_command_reader(path: Path):
+    """Decompress a zstd file through the zstd command.
+    
+    The process is always killed and reaped on exit, including when the
+    caller stops reading early.
+    
+    Args:
+        path: zstd-compressed file
+        
+    Yields:
+        Readable pipe with the decompressed bytes
+    """
+    process = subprocess.Popen(
+        ["zstd", "-dcq", str(path)], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        yield process.stdout
+        # Exited with an error before we stopped reading: corrupt input
+        if process.poll() not in (None, 0):
+            raise tarfile.ReadError(f"zstd exited with status {process.returncode}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+
+
+def _read_manifest(manifest_path: Union[str, Path]) -> Dict[str, Any]:
+    """Load an incremental backup manifest."""
+    with open(manifest_path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def _chunk_path(chunk_store: Path, chunk_hash: str, compression: str) -> Path:
+    """Get where the chunk store keeps a chunk."""
+    return chunk_store / chunk_hash[:2] / f"{chunk_hash}{CHUNK_EXTENSIONS[compression]}"
+
+
+def _read_chunk(chunk_path: Path, compression: str) -> bytes:
+    """Read and decompress one stored chunk.
+    
+    Args:
+        chunk_path: Chunk file path
+        compression: Compression the chunk was stored with
+        
+    Returns:
+        Uncompressed chunk data
+    """
+    with open(chunk_path, 'rb') as f:
+        payload = f.read()
+    
+    if compression == "zstd":
+        if zstandard is None:
+            raise ValueError("Reading zstd chunks requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(payload)
+    return gzip.decompress(payload)
+
+
+def _verify_manifest_chunks(manifest_path: Path, messages: List[Tuple[str, str]]) -> bool:
+    """Check that an incremental backup's chunks are all in the store.
+    
+    The chunks of the first few files are also read back and rehashed,
+    like the member read test done for archives.
+    
+    Args:
+        manifest_path: Manifest path
+        messages: List the (notifier method, message) pairs are added to
+        
+    Returns:
+        True if no chunk is missing or corrupt
+    """
+    manifest = _read_manifest(manifest_path)
+    chunk_store = manifest_path.parent / CHUNK_STORE_DIRNAME
+    compression = manifest["chunk_compression"]
+    chunk_hashes = {h for entry in manifest["files"] for h in entry["chunks"]}
+    
+    missing = [h for h in chunk_hashes if not _chunk_path(chunk_store, h, compression).exists()]
+    if missing:
+        messages.append(("error", f"Missing {len(missing)} of {len(chunk_hashes)} chunks"))
+        return False
+    messages.append(("info", f"All {len(chunk_hashes)} chunks present"))
+    
+    test_count = 0
+    for entry in manifest["files"][:5]:
+        for chunk_hash in entry["chunks"]:
+            hash_obj = new_hash(manifest["chunk_hash"])
+            hash_obj.update(_read_chunk(_chunk_path(chunk_store, chunk_hash, compression), compression))
+            if hash_obj.hexdigest() != chunk_hash:
+                messages.append(("error", f"Corrupt chunk {chunk_hash} in {entry['path']}"))
+                return False
+        test_count += 1
+    messages.append(("info", f"Successfully tested {test_count} backed up files"))
+    
+    return True
+
+
+def _verify_archive(backup_id: str, backup_file: str, checksum: Optional[str] = None,
+                    algorithm: Optional[str] = None) -> Tuple[bool, List[Tuple[str, str]]]:
+    """Check a backup archive's checksum and readability.
+    
+    Incremental backups are checked through their manifest and chunks.
+    
+    Kept at module level and free of the notifier so verify_all_backups
+    can run it in worker processes; the caller reports the messages.
+    
+    Args:
+        backup_id: Backup identifier, for messages
+        backup_file: Archive path
+        checksum: Expected checksum from the metadata, if any
+        algorithm: Algorithm the checksum was made with
+        
+    Returns:
+        Tuple of (valid, [(notifier method, message), ...])
+    """
+    messages = []
+    
+    try:
+        # Verify checksum if available
+        checksum_verified = False
+        if checksum and algorithm:
+            if calculate_checksum(backup_file, algorithm) != checksum:
+                messages.append(("failure", f"Checksum verification failed for {backup_id}"))
+                return False, messages
+            checksum_verified = True
+            messages.append(("info", "Checksum verification passed"))
+        
+        if backup_file.endswith(MANIFEST_EXTENSION):
+            return _verify_manifest_chunks(Path(backup_file), messages), messages
+        
+        # Verify tar file integrity
+        try:
+            with _open_archive(Path(backup_file)) as tar:
+                # Test the first few members as they stream past. A matching
+                # checksum already covers the whole archive, so only without
+                # one are the remaining headers walked
+                test_count = 0
+                member_count = 0
+                for member in tar:
+                    member_count += 1
+                    if test_count < 5:
+                        test_count += 1
+                        if member.isfile():
+                            # Test read without extracting
+                            f = tar.extractfile(member)
+                            if f:
+                                f.read(1024)  # Read first 1KB
+                                f.close()
+                            else:
+                                messages.append(("warning", f"Could not read member: {member.name}"))
+                    elif checksum_verified:
+                        break
+                
+                if not checksum_verified:
+                    messages.append(("info", f"Tar file contains {member_count} members"))
+                messages.append(("info", f"Successfully tested {test_count} archive members"))
+                
+        except tarfile.TarError as e:
+            messages.append(("error", f"Tar file verification failed: {str(e)}"))
+            return False, messages
+        
+        return True, messages
+        
+    except Exception as e:
+        messages.append(("error", f"Error verifying backup: {str(e)}"))
+        return False, messages
+
 
 class StorageManager:
     """Manages backup storage, retention, cleanup, and recovery operations."""
@@ -31,65 +276,152 @@ class StorageManager:
         self.notifier = notification_manager or NotificationManager(config)
         self.backup_destination = Path(config.backup_destination)
         ensure_directory(self.backup_destination)
+        
+        # (directory mtime, backups, backups by id, directory size) from the
+        # last listing
+        self._backup_cache = None
+        
+        # (monotonic time, status) from the last get_storage_status call
+        self._status_cache = None
     
     # ... rest of the class remains the same ...
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups with metadata.
         
         Returns:
-            List of backup metadata dictionaries
+            List of backup metadata dictionaries, with human-readable size
+            and modification time added
         """
-        backups = []
+        return [self._with_display_fields(backup) for backup in self._cached_backups()]
+    
+    def _cached_backups(self) -> List[Dict[str, Any]]:
+        """Get the raw backup listing used internally.
         
+        The listing is reused until the destination directory changes, so
+        repeated lookups in one process don't re-read every metadata file.
+        It only carries numeric file info; callers must not modify it.
+        
+        Returns:
+            List of backup metadata dictionaries, newest first
+        """
         try:
-            for backup_file in self.backup_destination.glob("*.tar.gz"):
-                metadata_file = self.backup_destination / f"{backup_file.name}.meta.json"
-                
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                        
-                        # Add file system info
-                        stat = backup_file.stat()
-                        metadata.update({
-                            "file_path": str(backup_file),
-                            "file_size": stat.st_size,
-                            "file_size_human": format_size(stat.st_size),
-                            "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            "exists": True
-                        })
-                        
-                        backups.append(metadata)
-                        
-                    except (json.JSONDecodeError, KeyError) as e:
-                        self.notifier.warning(f"Invalid metadata file: {metadata_file} - {str(e)}")
-                        
-                        # Create basic metadata for backup without valid metadata
-                        stat = backup_file.stat()
-                        backups.append({
-                            "backup_id": backup_file.stem.replace('.tar', ''),
-                            "backup_file": backup_file.name,
-                            "file_path": str(backup_file),
-                            "file_size": stat.st_size,
-                            "file_size_human": format_size(stat.st_size),
-                            "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                            "exists": True,
-                            "metadata_missing": True
-                        })
-                else:
-                    self.notifier.warning(f"Metadata file missing for: {backup_file.name}")
-            
-            # Sort by creation time (newest first)
-            backups.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-            
-            return backups
+            mtime = os.stat(self.backup_destination).st_mtime_ns
+            if self._backup_cache is None or self._backup_cache[0] != mtime:
+                backups, directory_size = self._scan_backups()
+                index = {}
+                for backup in backups:
+                    index.setdefault(backup.get("backup_id"), backup)
+                self._backup_cache = (mtime, backups, index, directory_size)
+            return self._backup_cache[1]
             
         except Exception as e:
             self.notifier.error(f"Error listing backups: {str(e)}")
             return []
     
+    def _scan_backups(self) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Read every backup's metadata from the destination directory.
+        
+        Returns:
+            Tuple of (backup metadata dictionaries newest first, directory
+            size in bytes or None if the directory holds anything besides
+            archives and their metadata)
+        """
+        backups = []
+        
+        # One directory scan gives both the archives and which metadata
+        # files exist, instead of an exists() and stat() call per backup
+        with os.scandir(self.backup_destination) as it:
+            all_entries = list(it)
+        entries = {entry.name: entry for entry in all_entries if not entry.name.startswith('.')}
+        
+        for name, entry in entries.items():
+            suffix = next((s for s in BACKUP_SUFFIXES if name.endswith(s)), None)
+            if suffix is None:
+                continue
+            backup_file = self.backup_destination / name
+            metadata_file = self.backup_destination / f"{name}.meta.json"
+            
+            if metadata_file.name in entries:
+                try:
+                    with open(metadata_file, 'rb') as f:
+                        metadata = json_loads(f.read())
+                    
+                    # Add file system info
+                    stat = entry.stat()
+                    metadata.update({
+                        "file_path": str(backup_file),
+                        "file_size": stat.st_size,
+                        "mtime_ts": stat.st_mtime,
+                        "exists": True
+                    })
+                    
+                    backups.append(metadata)
+                    
+                except (json.JSONDecodeError, KeyError) as e:
+                    self.notifier.warning(f"Invalid metadata file: {metadata_file} - {str(e)}")
+                    
+                    # Create basic metadata for backup without valid metadata
+                    stat = entry.stat()
+                    backups.append({
+                        "backup_id": name[:-len(suffix)],
+                        "backup_file": backup_file.name,
+                        "file_path": str(backup_file),
+                        "file_size": stat.st_size,
+                        "mtime_ts": stat.st_mtime,
+                        "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                        "exists": True,
+                        "metadata_missing": True
+                    })
+            else:
+                self.notifier.warning(f"Metadata file missing for: {backup_file.name}")
+        
+        # Sort by creation time (newest first)
+        backups.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        
+        return backups, self._sum_backup_entries(all_entries)
+    
+    @staticmethod
+    def _with_display_fields(backup: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached backup entry and add its human-readable fields.
+        
+        Cleanup and status only need the numbers, so the strings are built
+        here for the public results rather than for every scanned backup.
+        
+        Args:
+            backup: Backup metadata dictionary from the listing cache
+            
+        Returns:
+            New dictionary with file_size_human and last_modified set
+        """
+        result = dict(backup)
+        result["file_size_human"] = format_size(backup["file_size"])
+        result["last_modified"] = datetime.fromtimestamp(backup["mtime_ts"]).isoformat()
+        return result
+    
+    @staticmethod
+    def _sum_backup_entries(entries: List[os.DirEntry]) -> Optional[int]:
+        """Total the sizes of a flat directory of archives and metadata.
+        
+        The DirEntry stats are mostly cached by the listing already, so this
+        replaces a second walk of the destination.
+        
+        Args:
+            entries: Entries from one scandir of the destination
+            
+        Returns:
+            Total size in bytes, or None if any entry is something else
+            (chunk store, index, stray files) and needs a full walk
+        """
+        total_size = 0
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".meta.json"):
+                name = name[:-len(".meta.json")]
+            if not name.endswith(BACKUP_SUFFIXES) or not entry.is_file(follow_symlinks=False):
+                return None
+            total_size += entry.stat().st_size
+        return total_size
+    
     def get_backup_info(self, backup_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific backup.
         
@@ -99,10 +431,9 @@ class StorageManager:
         Returns:
             Backup metadata dictionary or None if not found
         """
-        backups = self.list_backups()
-        for backup in backups:
-            if backup.get("backup_id") == backup_id:
-                return backup
+        self._cached_backups()
+        if self._backup_cache is not None and backup_id in self._backup_cache[2]:
+            return self._with_display_fields(self._backup_cache[2][backup_id])
         
         self.notifier.error(f"Backup not found: {backup_id}")
         return None
@@ -118,12 +449,13 @@ class StorageManager:
         retention_count = self.config.retention_count
         retention_days = self.config.retention_days
         
-        backups = self.list_backups()
+        backups = self._cached_backups()
         cleanup_summary = {
             "total_backups": len(backups),
             "deleted_count": 0,
             "deleted_size": 0,
             "kept_count": 0,
+            "chunks_deleted": 0,
             "errors": []
         }
         
@@ -145,25 +477,41 @@ class StorageManager:
                     cleanup_summary["errors"].append(error_msg)
                     self.notifier.error(error_msg)
         
-        # Cleanup by age
+        # Cleanup by age. Backups are sorted newest first, so the expired
+        # ones are a run at the end of those kept by count: walk back from
+        # the oldest and stop at the first one still inside the window
         cutoff_date = datetime.now() - timedelta(days=retention_days)
         
-        for backup in backups:
+        for backup in reversed(backups[:retention_count]):
             try:
                 created_at = datetime.fromisoformat(backup.get("created_at", ""))
-                if created_at < cutoff_date:
-                    if self._delete_backup(backup):
-                        cleanup_summary["deleted_count"] += 1
-                        cleanup_summary["deleted_size"] += backup.get("file_size", 0)
-                        self.notifier.info(f"Deleted expired backup: {backup['backup_id']}")
-                    else:
-                        cleanup_summary["errors"].append(f"Failed to delete expired: {backup['backup_id']}")
-                        
             except (ValueError, TypeError):
                 self.notifier.warning(f"Invalid date format for backup: {backup['backup_id']}")
+                continue
+            
+            if created_at >= cutoff_date:
+                break
+            
+            if self._delete_backup(backup):
+                cleanup_summary["deleted_count"] += 1
+                cleanup_summary["deleted_size"] += backup.get("file_size", 0)
+                self.notifier.info(f"Deleted expired backup: {backup['backup_id']}")
+            else:
+                cleanup_summary["errors"].append(f"Failed to delete expired: {backup['backup_id']}")
         
         cleanup_summary["kept_count"] = cleanup_summary["total_backups"] - cleanup_summary["deleted_count"]
         
+        # Deleted incremental backups may have been the last users of chunks
+        if cleanup_summary["deleted_count"] and (self.backup_destination / CHUNK_STORE_DIRNAME).is_dir():
+            try:
+                chunks_deleted, chunks_size = self._collect_chunk_garbage()
+                cleanup_summary["chunks_deleted"] = chunks_deleted
+                cleanup_summary["deleted_size"] += chunks_size
+            except Exception as e:
+                error_msg = f"Error collecting unused chunks: {str(e)}"
+                cleanup_summary["errors"].append(error_msg)
+                self.notifier.error(error_msg)
+        
         self.notifier.success(
             f"Cleanup completed: deleted {cleanup_summary['deleted_count']} backups "
             f"({format_size(cleanup_summary['deleted_size'])}), kept {cleanup_summary['kept_count']}"
@@ -171,6 +519,64 @@ class StorageManager:
         
         return cleanup_summary
     
+    def _collect_chunk_garbage(self) -> Tuple[int, int]:
+        """Delete stored chunks that no incremental backup references.
+        
+        Every manifest in the destination counts, with or without metadata.
+        Index entries pointing at deleted chunks are dropped too, so the next
+        incremental backup stores those files again instead of reusing them.
+        
+        Returns:
+            Tuple of (chunks deleted, bytes freed)
+        """
+        referenced = set()
+        with os.scandir(self.backup_destination) as it:
+            manifests = [entry.path for entry in it if entry.name.endswith(MANIFEST_EXTENSION)]
+        for manifest_path in manifests:
+            # An unreadable manifest raises here, before anything is deleted
+            for entry in _read_manifest(manifest_path)["files"]:
+                referenced.update(entry["chunks"])
+        
+        chunk_store = self.backup_destination / CHUNK_STORE_DIRNAME
+        cutoff = time.time() - CHUNK_GC_GRACE_SECONDS
+        removed = set()
+        freed = 0
+        
+        with os.scandir(chunk_store) as prefixes:
+            prefix_dirs = [entry.path for entry in prefixes if entry.is_dir(follow_symlinks=False)]
+        for prefix_dir in prefix_dirs:
+            with os.scandir(prefix_dir) as it:
+                for entry in it:
+                    chunk_hash = entry.name.split('.', 1)[0]
+                    if chunk_hash in referenced or not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat()
+                    if stat.st_mtime >= cutoff:
+                        continue
+                    os.unlink(entry.path)
+                    removed.add(chunk_hash)
+                    freed += stat.st_size
+            try:
+                os.rmdir(prefix_dir)
+            except OSError:
+                pass  # still holds chunks
+        
+        index_path = self.backup_destination / INDEX_FILENAME
+        if removed and index_path.exists():
+            index = sqlite3.connect(index_path)
+            try:
+                rows = index.execute("SELECT path, chunks FROM files").fetchall()
+                stale = [(path,) for path, chunks in rows if not removed.isdisjoint(json_loads(chunks))]
+                with index:
+                    index.executemany("DELETE FROM files WHERE path = ?", stale)
+            finally:
+                index.close()
+        
+        if removed:
+            self.notifier.info(f"Deleted {len(removed)} unused chunks ({format_size(freed)})")
+        self._status_cache = None
+        return len(removed), freed
+    
     def _delete_backup(self, backup: Dict[str, Any]) -> bool:
         """Delete a backup and its metadata file.
         
@@ -192,6 +598,8 @@ class StorageManager:
             if metadata_file.exists():
                 metadata_file.unlink()
             
+            self._backup_cache = None
+            self._status_cache = None
             return True
             
         except Exception as e:
@@ -201,11 +609,20 @@ class StorageManager:
     def get_storage_status(self) -> Dict[str, Any]:
         """Get storage status and statistics.
         
+        Totals come from the backup metadata only; archives are never opened
+        here. The result is reused for a few seconds so frequent polling
+        doesn't rescan the destination each time.
+        
         Returns:
             Storage status dictionary
         """
+        if self._status_cache is not None:
+            cached_at, cached_status = self._status_cache
+            if time.monotonic() - cached_at < STATUS_CACHE_TTL:
+                return dict(cached_status)
+        
         try:
-            backups = self.list_backups()
+            backups = self._cached_backups()
             
             total_size = 0
             total_files = 0
@@ -223,8 +640,11 @@ class StorageManager:
                     if not newest_backup or created_at > newest_backup:
                         newest_backup = created_at
             
-            # Get directory size (includes all files)
-            directory_size = get_directory_size(self.backup_destination)
+            # Get directory size (includes all files); reuse the listing's
+            # scan unless the destination holds more than plain archives
+            directory_size = self._backup_cache[3] if self._backup_cache else None
+            if directory_size is None:
+                directory_size = get_directory_size(self.backup_destination)
             
             # Check alerts
             max_size_gb = self.config.get('monitoring.max_backup_size_gb', 10)
@@ -260,7 +680,8 @@ class StorageManager:
             for alert in alerts:
                 self.notifier.warning(alert)
             
-            return status
+            self._status_cache = (time.monotonic(), status)
+            return dict(status)
             
         except Exception as e:
             self.notifier.error(f"Error getting storage status: {str(e)}")
@@ -291,13 +712,21 @@ class StorageManager:
         try:
             self.notifier.info(f"Restoring backup {backup_id} to {restore_path}")
             
-            with tarfile.open(backup_file, 'r:gz') as tar:
+            if backup_file.name.endswith(MANIFEST_EXTENSION):
+                restored_count = self._restore_from_manifest(backup_file, restore_path_obj, files)
+                if files and restored_count == 0:
+                    self.notifier.warning("No files matched the specified patterns")
+                    return False
+                
+                self.notifier.success(f"Restored {restored_count} files")
+                return True
+            
+            with _open_archive(backup_file) as tar:
                 if files:
-                    # Restore specific files
+                    # Restore specific files in one forward pass over the archive
                     restored_count = 0
-                    for file_pattern in files:
-                        members = [m for m in tar.getmembers() if file_pattern in m.name]
-                        for member in members:
+                    for member in tar:
+                        if any(file_pattern in member.name for file_pattern in files):
                             tar.extract(member, restore_path_obj)
                             restored_count += 1
                             self.notifier.info(f"Restored: {member.name}")
@@ -320,6 +749,44 @@ class StorageManager:
             self.notifier.error(f"Error restoring backup: {str(e)}")
             return False
     
+    def _restore_from_manifest(self, manifest_path: Path, restore_path: Path,
+                               files: Optional[List[str]] = None) -> int:
+        """Rebuild files of an incremental backup from the chunk store.
+        
+        Args:
+            manifest_path: Manifest of the backup
+            restore_path: Directory to restore into
+            files: Name patterns to restore (None for all files)
+            
+        Returns:
+            Number of files restored
+        """
+        manifest = _read_manifest(manifest_path)
+        chunk_store = manifest_path.parent / CHUNK_STORE_DIRNAME
+        compression = manifest["chunk_compression"]
+        root = restore_path.resolve()
+        restored_count = 0
+        
+        for entry in manifest["files"]:
+            name = entry["path"]
+            if files and not any(file_pattern in name for file_pattern in files):
+                continue
+            
+            target = (root / name).resolve()
+            if root not in target.parents:
+                raise ValueError(f"Refusing to restore outside {root}: {name}")
+            
+            ensure_directory(target.parent)
+            with open(target, 'wb') as output:
+                for chunk_hash in entry["chunks"]:
+                    output.write(_read_chunk(_chunk_path(chunk_store, chunk_hash, compression), compression))
+            
+            restored_count += 1
+            if files:
+                self.notifier.info(f"Restored: {name}")
+        
+        return restored_count
+    
     def verify_backup(self, backup_id: str) -> bool:
         """Verify backup integrity.
         
@@ -343,47 +810,75 @@ class StorageManager:
                 self.notifier.error(f"Backup file not found: {backup_file}")
                 return False
             
-            # Verify checksum if available
-            if "checksum" in backup_info and "checksum_algorithm" in backup_info:
-                current_checksum = calculate_checksum(backup_file, backup_info["checksum_algorithm"])
-                if current_checksum != backup_info["checksum"]:
-                    self.notifier.failure(f"Checksum verification failed for {backup_id}")
-                    return False
-                else:
-                    self.notifier.info("Checksum verification passed")
-            
-            # Verify tar file integrity
-            try:
-                with tarfile.open(backup_file, 'r:gz') as tar:
-                    # Try to list all members
-                    members = tar.getmembers()
-                    self.notifier.info(f"Tar file contains {len(members)} members")
-                    
-                    # Test extraction of first few files
-                    test_count = min(5, len(members))
-                    for i, member in enumerate(members[:test_count]):
-                        if member.isfile():
-                            # Test read without extracting
-                            f = tar.extractfile(member)
-                            if f:
-                                f.read(1024)  # Read first 1KB
-                                f.close()
-                            else:
-                                self.notifier.warning(f"Could not read member: {member.name}")
-                    
-                    self.notifier.info(f"Successfully tested {test_count} archive members")
-                    
-            except tarfile.TarError as e:
-                self.notifier.error(f"Tar file verification failed: {str(e)}")
-                return False
-            
-            self.notifier.success(f"Backup verification completed successfully: {backup_id}")
-            return True
+            valid, messages = _verify_archive(
+                backup_id, str(backup_file), backup_info.get("checksum"), backup_info.get("checksum_algorithm")
+            )
+            self._report_verification(backup_id, valid, messages)
+            return valid
             
         except Exception as e:
             self.notifier.error(f"Error verifying backup: {str(e)}")
             return False
     
+    def verify_all_backups(self, max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """Verify every backup, several at a time.
+        
+        Checksums and decompression are CPU-bound per archive, so backups
+        are checked in separate processes. For a single backup use
+        verify_backup.
+        
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            
+        Returns:
+            Mapping of backup ID to whether it is valid
+        """
+        backups = self._cached_backups()
+        results = {}
+        if not backups:
+            return results
+        
+        self.notifier.info(f"Verifying {len(backups)} backups...")
+        workers = min(max_workers or os.cpu_count() or 1, len(backups))
+        # Spawned rather than forked workers: a fork taken after blake3 has
+        # started its thread pool deadlocks on the first hash in the child
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            futures = {
+                executor.submit(
+                    _verify_archive, backup["backup_id"], backup["file_path"],
+                    backup.get("checksum"), backup.get("checksum_algorithm")
+                ): backup["backup_id"]
+                for backup in backups
+            }
+            
+            for future in as_completed(futures):
+                backup_id = futures[future]
+                try:
+                    valid, messages = future.result()
+                except Exception as e:
+                    valid, messages = False, [("error", f"Error verifying backup: {str(e)}")]
+                self._report_verification(backup_id, valid, messages)
+                results[backup_id] = valid
+        
+        valid_count = sum(results.values())
+        self.notifier.info(f"Verified {len(results)} backups: {valid_count} valid, {len(results) - valid_count} invalid")
+        return results
+    
+    def _report_verification(self, backup_id: str, valid: bool,
+                             messages: List[Tuple[str, str]]) -> None:
+        """Send a verification's messages and outcome to the notifier.
+        
+        Args:
+            backup_id: Backup identifier
+            valid: Whether the backup passed
+            messages: (notifier method, message) pairs from _verify_archive
+        """
+        for level, message in messages:
+            getattr(self.notifier, level)(message)
+        if valid:
+            self.notifier.success(f"Backup verification completed successfully: {backup_id}")
+    
     def list_backup_contents(self, backup_id: str) -> List[Dict[str, Any]]:
         """List contents of a backup.
         
@@ -401,8 +896,22 @@ class StorageManager:
         contents = []
         
         try:
-            with tarfile.open(backup_file, 'r:gz') as tar:
-                for member in tar.getmembers():
+            if backup_file.name.endswith(MANIFEST_EXTENSION):
+                # Manifests record names and sizes only
+                for entry in _read_manifest(backup_file)["files"]:
+                    contents.append({
+                        "name": entry["path"],
+                        "type": "file",
+                        "size": entry["size"],
+                        "size_human": format_size(entry["size"]),
+                        "mode": "",
+                        "modified": ""
+                    })
+                contents.sort(key=itemgetter("name"))
+                return contents
+            
+            with _open_archive(backup_file, stream=True) as tar:
+                for member in tar:
                     contents.append({
                         "name": member.name,
                         "type": "file" if member.isfile() else "directory" if member.isdir() else "other",
@@ -413,7 +922,7 @@ class StorageManager:
                     })
             
             # Sort by name
-            contents.sort(key=lambda x: x["name"])
+            contents.sort(key=itemgetter("name"))
             
             return contents
             
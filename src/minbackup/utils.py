@@ -2,23 +2,65 @@
 
 import os
 import sys
+import json
+import zlib
+import mmap
+import queue
 import logging
 import hashlib
+import threading
+import dataclasses
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
+
+try:
+    from blake3 import blake3
+except ImportError:  # optional dependency
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import google_crc32c
+except ImportError:  # optional dependency
+    google_crc32c = None
+
+
+# BLAKE3 is SIMD-accelerated and multi-threaded; fall back to SHA-256 without it
+DEFAULT_CHECKSUM_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+# Files at least this large are hashed through mmap instead of read() chunks
+MMAP_CHECKSUM_THRESHOLD = 64 * 1024 * 1024
+
+# HashingWriter hands data to its hashing thread in chunks of this size
+HASH_CHUNK_SIZE = 1024 * 1024
+HASH_QUEUE_SIZE = 16
+
+# CRC32C uses the SSE4.2/ARMv8 CRC instructions; zlib's CRC32 is the fallback
+DEFAULT_CRC_ALGORITHM = "crc32c" if google_crc32c is not None else "crc32"
+
+# Snapshot name prefixes used to classify snapshots (str.startswith accepts tuples)
+AUTO_SNAPSHOT_PREFIXES = ("auto",)
+MINBACKUP_SNAPSHOT_PREFIXES = ("minbackup", "backup")
+MANAGED_SNAPSHOT_PREFIXES = AUTO_SNAPSHOT_PREFIXES + MINBACKUP_SNAPSHOT_PREFIXES
 
 
 class NotificationManager:
     """Simple notification manager for console and file logging."""
     
-    def __init__(self, config):
+    def __init__(self, config, level: Optional[str] = None):
         """Initialize notification manager.
         
         Args:
             config: Configuration object
+            level: Log level for this run, overriding notifications.level (optional)
         """
         self.config = config
+        self.level = level or config.get('notifications.level', 'INFO')
         self.logger = self._setup_logger()
         self.use_unicode = self._check_unicode_support()
     
@@ -39,7 +81,7 @@ class NotificationManager:
         logger.handlers.clear()
         
         # Set log level
-        level = getattr(logging, self.config.get('notifications.level', 'INFO'))
+        level = getattr(logging, self.level)
         logger.setLevel(level)
         
         # Console handler with encoding fix
@@ -90,27 +132,30 @@ class NotificationManager:
             ascii_prefix = ascii_prefixes.get(prefix, prefix)
             return f"{ascii_prefix} {message}"
     
-    def info(self, message: str) -> None:
+    # Extra args are %-style arguments for the message, as with logging, so
+    # formatting is skipped when the level is disabled
+    
+    def info(self, message: str, *args: Any) -> None:
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def success(self, message: str) -> None:
+    def success(self, message: str, *args: Any) -> None:
         """Log success message."""
         formatted_message = self._format_message(message, "✅")
-        self.logger.info(formatted_message)
+        self.logger.info(formatted_message, *args)
     
-    def failure(self, message: str) -> None:
+    def failure(self, message: str, *args: Any) -> None:
         """Log failure message."""
         formatted_message = self._format_message(message, "❌")
-        self.logger.error(formatted_message)
+        self.logger.error(formatted_message, *args)
 
 
 def generate_timestamp() -> str:
@@ -122,6 +167,22 @@ def generate_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+def new_hash(algorithm: str = 'sha256'):
+    """Create a hash object for the given algorithm.
+    
+    Args:
+        algorithm: Hash algorithm name ('blake3' or any hashlib algorithm)
+        
+    Returns:
+        Hash object supporting update() and hexdigest()
+    """
+    if algorithm == 'blake3':
+        if blake3 is None:
+            raise ValueError("blake3 checksums require the 'blake3' package")
+        return blake3(max_threads=blake3.AUTO)
+    return hashlib.new(algorithm)
+
+
 def calculate_checksum(file_path: Union[str, Path], algorithm: str = 'sha256') -> str:
     """Calculate checksum for a file.
     
@@ -132,15 +193,282 @@ def calculate_checksum(file_path: Union[str, Path], algorithm: str = 'sha256') -
     Returns:
         Hexadecimal checksum string
     """
-    hash_obj = hashlib.new(algorithm)
+    hash_obj = new_hash(algorithm)
+    
+    if algorithm == 'blake3':
+        # Let blake3 mmap the file and hash it across threads
+        hash_obj.update_mmap(file_path)
+        return hash_obj.hexdigest()
     
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_obj.update(chunk)
+        if os.fstat(f.fileno()).st_size >= MMAP_CHECKSUM_THRESHOLD:
+            # Hash straight from the page cache without per-chunk bytes copies
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                hash_obj.update(mm)
+        elif hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: readinto() a single reused buffer instead of
+            # allocating bytes per read; about 10% faster than the loop below
+            return hashlib.file_digest(f, lambda: hash_obj).hexdigest()
+        else:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                hash_obj.update(chunk)
     
     return hash_obj.hexdigest()
 
 
+def crc_extend(crc: int, data, algorithm: str = DEFAULT_CRC_ALGORITHM) -> int:
+    """Extend a running CRC with more data.
+    
+    Args:
+        crc: CRC of the preceding data (0 to start)
+        data: Bytes-like data
+        algorithm: 'crc32c' or 'crc32'
+        
+    Returns:
+        Updated CRC value
+    """
+    if algorithm == 'crc32c':
+        if google_crc32c is None:
+            raise ValueError("crc32c checksums require the 'google-crc32c' package")
+        # google_crc32c only accepts bytes
+        return google_crc32c.extend(crc, bytes(data))
+    return zlib.crc32(data, crc)
+
+
+class ChunkedCRC:
+    """Computes one CRC per fixed-size chunk of a byte stream."""
+    
+    def __init__(self, chunk_size: int, algorithm: str = DEFAULT_CRC_ALGORITHM):
+        """Initialize chunked CRC.
+        
+        Args:
+            chunk_size: Number of bytes covered by each CRC
+            algorithm: 'crc32c' or 'crc32'
+        """
+        self.chunk_size = chunk_size
+        self.algorithm = algorithm
+        self.crcs = []
+        self._crc = 0
+        self._filled = 0
+    
+    def update(self, data) -> None:
+        """Add data to the stream."""
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self.chunk_size - self._filled)
+            self._crc = crc_extend(self._crc, view[:take], self.algorithm)
+            self._filled += take
+            view = view[take:]
+            if self._filled == self.chunk_size:
+                self.crcs.append(self._crc)
+                self._crc = 0
+                self._filled = 0
+    
+    def finish(self) -> list:
+        """Close the final partial chunk and return all chunk CRCs."""
+        if self._filled:
+            self.crcs.append(self._crc)
+            self._crc = 0
+            self._filled = 0
+        return self.crcs
+
+
+def calculate_chunk_crcs(file_path: Union[str, Path], chunk_size: int,
+                         algorithm: str = DEFAULT_CRC_ALGORITHM) -> list:
+    """Calculate per-chunk CRCs for a file.
+    
+    Args:
+        file_path: Path to file
+        chunk_size: Number of bytes covered by each CRC
+        algorithm: 'crc32c' or 'crc32'
+        
+    Returns:
+        List of CRC values, one per chunk
+    """
+    crcs = []
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            crcs.append(crc_extend(0, chunk, algorithm))
+    return crcs
+
+
+class HashingWriter:
+    """File-like wrapper that hashes data as it is written.
+    
+    Lets callers checksum an archive while it is produced instead of
+    re-reading the finished file. Hashing runs on a background thread fed
+    through a bounded queue so it overlaps with compression and I/O.
+    """
+    
+    def __init__(self, fileobj, algorithm: str = 'sha256', chunk_crc: Optional[ChunkedCRC] = None):
+        """Initialize hashing writer.
+        
+        Args:
+            fileobj: Underlying binary file object
+            algorithm: Hash algorithm to use
+            chunk_crc: Optional per-chunk CRC fed on the same thread
+        """
+        self.fileobj = fileobj
+        self.bytes_written = 0
+        self._hash = new_hash(algorithm)
+        self._buffer = bytearray()
+        self._queue = queue.Queue(maxsize=HASH_QUEUE_SIZE)
+        self._error = None
+        hashers = [self._hash] if chunk_crc is None else [self._hash, chunk_crc]
+        self._thread = threading.Thread(target=self._hash_worker, args=(hashers,), daemon=True)
+        self._thread.start()
+    
+    def _hash_worker(self, hashers: list) -> None:
+        """Feed queued chunks into each hasher until a None sentinel arrives.
+        
+        A failing hasher is recorded and the queue is still drained, so
+        producers never block on a full queue; the error is re-raised to them.
+        """
+        for chunk in iter(self._queue.get, None):
+            if self._error is not None:
+                continue
+            try:
+                for hasher in hashers:
+                    hasher.update(chunk)
+            except Exception as e:
+                self._error = e
+    
+    def _raise_error(self) -> None:
+        """Re-raise an error from the hashing thread, if any."""
+        if self._error is not None:
+            raise self._error
+    
+    def write(self, data) -> int:
+        """Queue a chunk of data for hashing and write it."""
+        self._raise_error()
+        if not self._buffer and type(data) is bytes and len(data) >= HASH_CHUNK_SIZE:
+            # Large immutable chunks can be handed over without copying
+            self._queue.put(data)
+        else:
+            self._buffer += data
+            if len(self._buffer) >= HASH_CHUNK_SIZE:
+                self._queue.put(self._buffer)
+                self._buffer = bytearray()
+        self.bytes_written += len(data)
+        return self.fileobj.write(data)
+    
+    def flush(self) -> None:
+        """Flush the underlying file object."""
+        self.fileobj.flush()
+    
+    def close(self) -> None:
+        """Hash any buffered data and stop the hashing thread.
+        
+        The underlying file object is left open.
+        """
+        if self._thread.is_alive():
+            if self._buffer:
+                self._queue.put(self._buffer)
+                self._buffer = bytearray()
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+    
+    def hexdigest(self) -> str:
+        """Return the hexadecimal digest of everything written.
+        
+        No more data may be written after calling this.
+        """
+        self.close()
+        return self._hash.hexdigest()
+
+
+def json_loads(data: Union[str, bytes]):
+    """Parse JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, default=_json_default)
+
+
+def json_dump(data, stream) -> None:
+    """Write indented JSON to a text stream without an intermediate str.
+    
+    With orjson the encoded bytes go straight to the stream's binary buffer;
+    the stdlib encoder writes chunks to the stream as it encodes.
+    
+    Args:
+        data: JSON-serializable data
+        stream: Text stream such as sys.stdout
+    """
+    buffer = getattr(stream, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Keep ordering with anything already written through the text layer
+        stream.flush()
+        buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        buffer.flush()
+    else:
+        json.dump(data, stream, indent=2, default=_json_default)
+        stream.write("\n")
+        stream.flush()
+
+
+def _json_default(obj):
+    """Serialize dataclasses and datetimes the way orjson does natively."""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json_atomic(path: Union[str, Path], data) -> None:
+    """Write JSON to a file atomically.
+    
+    The data is written to a temporary file next to path and moved into
+    place with os.replace, so readers never see a partially written file.
+    The temporary name is unique per process and thread, so concurrent
+    writers of the same file never publish each other's partial output.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, default=_json_default).encode()
+    
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
 def format_size(size_bytes: int) -> str:
     """Format file size in human readable format.
     
@@ -166,12 +494,24 @@ def get_directory_size(directory: Union[str, Path]) -> int:
     Returns:
         Total size in bytes
     """
+    # Iterative scandir walk: no per-file path joins, and d_type answers
+    # the file/directory checks without extra stat calls
     total_size = 0
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            if os.path.exists(filepath):
-                total_size += os.path.getsize(filepath)
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                except OSError:
+                    pass
     return total_size
 
 
@@ -1,18 +1,37 @@
 """VM snapshot management for multiple virtualization platforms."""
 
 import subprocess
-import json
 import re
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-from .utils import NotificationManager, generate_timestamp, is_command_available
+from .utils import (
+    NotificationManager, generate_timestamp, is_command_available, json_loads,
+    MINBACKUP_SNAPSHOT_PREFIXES, MANAGED_SNAPSHOT_PREFIXES,
+)
+
+# Command line tool each platform is driven through
+PLATFORM_COMMANDS = {
+    "multipass": "multipass",
+    "virtualbox": "vboxmanage",
+    "vmware": "vmrun",
+}
+
+# Seconds a VM or snapshot listing is reused within one VMManager
+QUERY_CACHE_TTL = 5
+
+# `vboxmanage list vms` prints one `"name" {uuid}` line per VM
+VBOX_LIST_VMS_RE = re.compile(r'^"([^"]+)"\s+\{([^}]+)\}', re.MULTILINE)
 
 
 class VMPlatform(ABC):
     """Abstract base class for VM platform implementations."""
     
+    # True when list_all_snapshots needs one command for any number of VMs
+    batch_snapshot_listing = False
+    
     def __init__(self, config, notifier: NotificationManager):
         self.config = config
         self.notifier = notifier
@@ -50,6 +69,10 @@ class VMPlatform(ABC):
         """Delete VM snapshot."""
         pass
     
+    def list_all_snapshots(self, vm_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """List snapshots for several VMs, keyed by VM name (one query per VM by default)."""
+        return {vm_name: self.list_snapshots(vm_name) for vm_name in vm_names}
+    
     def is_available(self) -> bool:
         """Check if platform is available."""
         return is_command_available(self.command_name)
@@ -76,13 +99,15 @@ class VMPlatform(ABC):
 class MultipassPlatform(VMPlatform):
     """Multipass VM platform implementation using real snapshot functionality."""
     
+    batch_snapshot_listing = True
+    
     @property
     def platform_name(self) -> str:
         return "multipass"
     
     @property
     def command_name(self) -> str:
-        return "multipass"
+        return PLATFORM_COMMANDS["multipass"]
     
     def _generate_valid_snapshot_name(self, custom_name: Optional[str] = None) -> str:
         """Generate a valid Multipass snapshot name."""
@@ -106,7 +131,7 @@ class MultipassPlatform(VMPlatform):
         try:
             result = self._run_command(["multipass", "list", "--format", "json"])
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = json_loads(result.stdout)
                 return [
                     {
                         "name": vm["name"],
@@ -186,14 +211,18 @@ class MultipassPlatform(VMPlatform):
     
     def list_snapshots(self, vm_name: str) -> List[Dict[str, Any]]:
         """List Multipass snapshots for a specific VM."""
+        return self.list_all_snapshots([vm_name])[vm_name]
+    
+    def list_all_snapshots(self, vm_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """List Multipass snapshots for several VMs from one `multipass list --snapshots`."""
+        listing = {vm_name: [] for vm_name in vm_names}
         try:
             result = self._run_command(["multipass", "list", "--snapshots"])
             
             if result.returncode != 0:
                 self.notifier.error(f"Failed to list snapshots: {result.stderr}")
-                return []
+                return listing
             
-            snapshots = []
             lines = result.stdout.strip().split('\n')
             
             if lines and ("Instance" in lines[0] and "Snapshot" in lines[0]):
@@ -206,7 +235,8 @@ class MultipassPlatform(VMPlatform):
                         instance_name = parts[0]
                         snapshot_name = parts[1]
                         
-                        if instance_name == vm_name:
+                        snapshots = listing.get(instance_name)
+                        if snapshots is not None:
                             comment = ""
                             if len(parts) > 3:
                                 comment = " ".join(parts[3:])
@@ -221,22 +251,22 @@ class MultipassPlatform(VMPlatform):
                                     # Extract timestamp after "at "
                                     timestamp_str = comment.split("at ")[-1].split("…")[0]
                                     timestamp = datetime.fromisoformat(timestamp_str.replace("â€¦", ""))
-                                except:
+                                except ValueError:
                                     timestamp = None
                             
                             snapshots.append({
                                 "name": snapshot_name,
-                                "vm_name": vm_name,
+                                "vm_name": instance_name,
                                 "created_at": created_at,
                                 "timestamp": timestamp,
                                 "platform": self.platform_name
                             })
             
-            return snapshots
+            return listing
             
         except Exception as e:
             self.notifier.error(f"Error listing snapshots: {str(e)}")
-            return []
+            return {vm_name: [] for vm_name in vm_names}
     
     def delete_snapshot(self, vm_name: str, snapshot_name: str, purge: bool = True) -> bool:
         """Delete Multipass snapshot with proper two-step process."""
@@ -340,7 +370,7 @@ class MultipassPlatform(VMPlatform):
             # Filter only MinBackup snapshots (those starting with "minbackup" or "backup")
             minbackup_snapshots = [
                 s for s in all_snapshots 
-                if s["name"].startswith("auto") or s["name"].startswith("minbackup") or s["name"].startswith("backup")
+                if s["name"].startswith(MANAGED_SNAPSHOT_PREFIXES)
             ]
             
             if len(minbackup_snapshots) <= retention_count:
@@ -350,7 +380,7 @@ class MultipassPlatform(VMPlatform):
             # Sort by timestamp if available, otherwise by name
             try:
                 minbackup_snapshots.sort(key=lambda x: x.get("timestamp") or datetime.min, reverse=True)
-            except:
+            except TypeError:
                 minbackup_snapshots.sort(key=lambda x: x.get("name", ""), reverse=True)
             
             # Delete old snapshots
@@ -383,7 +413,7 @@ class VirtualBoxPlatform(VMPlatform):
     
     @property
     def command_name(self) -> str:
-        return "vboxmanage"
+        return PLATFORM_COMMANDS["virtualbox"]
     
     def list_vms(self) -> List[Dict[str, Any]]:
         """List VirtualBox VMs."""
@@ -391,29 +421,23 @@ class VirtualBoxPlatform(VMPlatform):
             result = self._run_command(["vboxmanage", "list", "vms"])
             if result.returncode == 0:
                 vms = []
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        match = re.match(r'"([^"]+)"\s+\{([^}]+)\}', line)
-                        if match:
-                            vm_name = match.group(1)
-                            vm_uuid = match.group(2)
-                            
-                            state_result = self._run_command([
-                                "vboxmanage", "showvminfo", vm_uuid, "--machinereadable"
-                            ])
-                            state = "unknown"
-                            if state_result.returncode == 0:
-                                for state_line in state_result.stdout.split('\n'):
-                                    if state_line.startswith('VMState='):
-                                        state = state_line.split('=')[1].strip('"')
-                                        break
-                            
-                            vms.append({
-                                "name": vm_name,
-                                "uuid": vm_uuid,
-                                "state": state,
-                                "platform": self.platform_name
-                            })
+                for vm_name, vm_uuid in VBOX_LIST_VMS_RE.findall(result.stdout):
+                    state_result = self._run_command([
+                        "vboxmanage", "showvminfo", vm_uuid, "--machinereadable"
+                    ])
+                    state = "unknown"
+                    if state_result.returncode == 0:
+                        for state_line in state_result.stdout.split('\n'):
+                            if state_line.startswith('VMState='):
+                                state = state_line.split('=')[1].strip('"')
+                                break
+                    
+                    vms.append({
+                        "name": vm_name,
+                        "uuid": vm_uuid,
+                        "state": state,
+                        "platform": self.platform_name
+                    })
                 return vms
             else:
                 self.notifier.error(f"Failed to list VMs: {result.stderr}")
@@ -504,7 +528,7 @@ class VMwarePlatform(VMPlatform):
     
     @property
     def command_name(self) -> str:
-        return "vmrun"
+        return PLATFORM_COMMANDS["vmware"]
     
     def list_vms(self) -> List[Dict[str, Any]]:
         """List VMware VMs."""
@@ -608,11 +632,32 @@ class VMManager:
         
         self.available_platforms = self._detect_platforms()
         
+        # (platform, call, args) -> (monotonic time, result)
+        self._query_cache = {}
+        
         if not self.available_platforms:
             self.notifier.warning("No VM platforms detected")
         else:
             self.notifier.info(f"Available VM platforms: {', '.join(self.available_platforms.keys())}")
     
+    @staticmethod
+    def detect_platforms(config) -> List[str]:
+        """Detect installed VM platforms from PATH alone.
+        
+        Unlike constructing a VMManager, this builds no platform objects and
+        logs nothing, for callers that only report what is installed.
+        
+        Args:
+            config: Configuration providing the supported platform names
+            
+        Returns:
+            Names of supported platforms whose command is on PATH
+        """
+        return [
+            name for name in config.supported_vm_platforms
+            if name in PLATFORM_COMMANDS and is_command_available(PLATFORM_COMMANDS[name])
+        ]
+    
     def _detect_platforms(self) -> Dict[str, VMPlatform]:
         """Detect available VM platforms."""
         available = {}
@@ -629,13 +674,32 @@ class VMManager:
         
         return available
     
+    def _cached_query(self, key: tuple, compute) -> List[Dict[str, Any]]:
+        """Reuse a platform listing made within the last QUERY_CACHE_TTL seconds."""
+        now = time.monotonic()
+        entry = self._query_cache.get(key)
+        if entry is None or now - entry[0] > QUERY_CACHE_TTL:
+            entry = (now, compute())
+            self._query_cache[key] = entry
+        # Callers sort listings in place; keep the cached list intact
+        return list(entry[1])
+    
+    def invalidate_cache(self):
+        """Forget cached listings, e.g. after snapshots were created or deleted."""
+        self._query_cache.clear()
+    
+    def list_vms(self, platform_name: str) -> List[Dict[str, Any]]:
+        """List VMs on one available platform."""
+        platform = self.available_platforms[platform_name]
+        return self._cached_query((platform_name, "list_vms"), platform.list_vms)
+    
     def list_all_vms(self) -> Dict[str, List[Dict[str, Any]]]:
         """List VMs from all available platforms."""
         all_vms = {}
         
-        for platform_name, platform in self.available_platforms.items():
+        for platform_name in self.available_platforms:
             try:
-                vms = platform.list_vms()
+                vms = self.list_vms(platform_name)
                 all_vms[platform_name] = vms
                 self.notifier.info(f"Found {len(vms)} VMs on {platform_name}")
             except Exception as e:
@@ -666,12 +730,14 @@ class VMManager:
                 self.notifier.error(f"VM not found: {vm_name}")
                 return False
         
-        return platform_obj.create_snapshot(vm_name, snapshot_name)
+        success = platform_obj.create_snapshot(vm_name, snapshot_name)
+        self.invalidate_cache()
+        return success
     
     def _find_vm_platform(self, vm_name: str) -> Optional[VMPlatform]:
         """Find which platform has the specified VM."""
         for platform_name, platform in self.available_platforms.items():
-            vms = platform.list_vms()
+            vms = self.list_vms(platform_name)
             for vm in vms:
                 if vm["name"] == vm_name:
                     return platform
@@ -690,7 +756,30 @@ class VMManager:
                 self.notifier.error(f"VM not found: {vm_name}")
                 return []
         
-        return platform_obj.list_snapshots(vm_name)
+        return self._cached_query(
+            (platform_obj.platform_name, "list_snapshots", vm_name),
+            lambda: platform_obj.list_snapshots(vm_name)
+        )
+    
+    def list_all_snapshots(self, platform_name: str, vm_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """List snapshots for several VMs on one available platform.
+        
+        The per-VM listings are cached as well, so later list_snapshots calls
+        for these VMs reuse this query.
+        
+        Args:
+            platform_name: Platform the VMs belong to
+            vm_names: Names of the VMs to list
+            
+        Returns:
+            Dictionary mapping each VM name to its snapshots
+        """
+        platform = self.available_platforms[platform_name]
+        now = time.monotonic()
+        listing = platform.list_all_snapshots(vm_names)
+        for vm_name, snapshots in listing.items():
+            self._query_cache[(platform_name, "list_snapshots", vm_name)] = (now, snapshots)
+        return {vm_name: list(snapshots) for vm_name, snapshots in listing.items()}
     
     def delete_snapshot(self, vm_name: str, snapshot_name: str, 
                        platform: Optional[str] = None, purge: bool = True) -> bool:
@@ -706,7 +795,9 @@ class VMManager:
                 self.notifier.error(f"VM not found: {vm_name}")
                 return False
         
-        return platform_obj.delete_snapshot(vm_name, snapshot_name, purge)
+        success = platform_obj.delete_snapshot(vm_name, snapshot_name, purge)
+        self.invalidate_cache()
+        return success
     
     def delete_all_snapshots(self, vm_name: str, platform: Optional[str] = None, 
                            purge: bool = True) -> int:
@@ -722,15 +813,18 @@ class VMManager:
                 self.notifier.error(f"VM not found: {vm_name}")
                 return 0
         
-        if hasattr(platform_obj, 'delete_all_snapshots'):
-            return platform_obj.delete_all_snapshots(vm_name, purge)
-        else:
-            snapshots = platform_obj.list_snapshots(vm_name)
-            deleted_count = 0
-            for snapshot in snapshots:
-                if platform_obj.delete_snapshot(vm_name, snapshot['name'], purge):
-                    deleted_count += 1
-            return deleted_count
+        try:
+            if hasattr(platform_obj, 'delete_all_snapshots'):
+                return platform_obj.delete_all_snapshots(vm_name, purge)
+            else:
+                snapshots = platform_obj.list_snapshots(vm_name)
+                deleted_count = 0
+                for snapshot in snapshots:
+                    if platform_obj.delete_snapshot(vm_name, snapshot['name'], purge):
+                        deleted_count += 1
+                return deleted_count
+        finally:
+            self.invalidate_cache()
     
     def cleanup_old_snapshots(self) -> Dict[str, Any]:
         """Clean up old snapshots based on retention policy."""
@@ -745,7 +839,7 @@ class VMManager:
         
         for platform_name, platform in self.available_platforms.items():
             try:
-                vms = platform.list_vms()
+                vms = self.list_vms(platform_name)
                 for vm in vms:
                     vm_name = vm["name"]
                     cleanup_summary["vms_processed"] += 1
@@ -759,7 +853,7 @@ class VMManager:
                         snapshots = platform.list_snapshots(vm_name)
                         minbackup_snapshots = [
                             s for s in snapshots 
-                            if s["name"].startswith("minbackup") or s["name"].startswith("backup")
+                            if s["name"].startswith(MINBACKUP_SNAPSHOT_PREFIXES)
                         ]
                         
                         if len(minbackup_snapshots) > retention_count:
@@ -780,6 +874,8 @@ class VMManager:
                 cleanup_summary["errors"].append(error_msg)
                 self.notifier.error(error_msg)
         
+        self.invalidate_cache()
+        
         if cleanup_summary["total_deleted"] > 0:
             self.notifier.success(f"Deleted {cleanup_summary['total_deleted']} old snapshots from {cleanup_summary['vms_processed']} VMs")
         else: